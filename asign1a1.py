@@ -4,9 +4,14 @@ asign1a1.py
 Implementación del problema de Asignación 1 a 1.
 """
 
-from typing import List, Tuple
+import heapq
+from array import array
+from operator import itemgetter
+from typing import Iterable, List, Tuple
 from dataclasses import dataclass
 
+from busqueda import MotorBacktracking
+
 
 @dataclass
 class SolucionAsigna1a1:
@@ -14,6 +19,61 @@ class SolucionAsigna1a1:
     asignado: List[int]
     ganancia: int
     soluciones_factibles: int = 0
+    nodos_expandidos: int = 0
+
+
+@dataclass
+class MatrizDispersa:
+    """
+    Matriz de ganancias dispersa en formato CSR.
+    
+    Filas y columnas se numeran desde 1. Las aristas permitidas de la fila i
+    ocupan las posiciones inicio[i]..inicio[i+1]-1 de columna y ganancia;
+    las parejas ausentes están prohibidas.
+    """
+    filas: int
+    columnas: int
+    inicio: array
+    columna: array
+    ganancia: array
+    
+    @classmethod
+    def desde_aristas(cls, filas: int, columnas: int,
+                      aristas: Iterable[Tuple[int, int, int]]) -> 'MatrizDispersa':
+        """
+        Construye la matriz a partir de tripletas (fila, columna, ganancia).
+        
+        Args:
+            filas: Número de filas (agentes)
+            columnas: Número de columnas (tareas)
+            aristas: Parejas permitidas con su ganancia
+        """
+        aristas = list(aristas)
+        inicio = array('l', [0]) * (filas + 2)
+        for i, _, _ in aristas:
+            inicio[i + 1] += 1
+        for i in range(2, filas + 2):
+            inicio[i] += inicio[i - 1]
+        
+        columna = array('l', [0]) * len(aristas)
+        ganancia = array('q', [0]) * len(aristas)
+        siguiente = inicio[:]
+        for i, j, g in aristas:
+            k = siguiente[i]
+            columna[k] = j
+            ganancia[k] = g
+            siguiente[i] = k + 1
+        
+        return cls(filas, columnas, inicio, columna, ganancia)
+    
+    @classmethod
+    def desde_densa(cls, matriz: List[List[int]], tamano: int) -> 'MatrizDispersa':
+        """Convierte una matriz densa indexada desde 1 (todas permitidas)."""
+        return cls.desde_aristas(
+            tamano, tamano,
+            ((i, j, matriz[i][j])
+             for i in range(1, tamano + 1) for j in range(1, tamano + 1))
+        )
 
 
 class ProblemaAsigna1a1:
@@ -24,8 +84,9 @@ class ProblemaAsigna1a1:
         Inicializa el problema de asignación 1 a 1.
         
         Args:
-            matriz: Matriz de ganancias
-            tamano: Número de elementos a asignar
+            matriz: Matriz de ganancias. Puede ser una MatrizDispersa; en ese
+                caso solo busqueda_caminos_aumentantes está disponible.
+            tamano: Número de elementos a asignar (filas)
         """
         self.matriz = matriz
         self.tamano = tamano
@@ -66,36 +127,13 @@ class ProblemaAsigna1a1:
         Returns:
             Solución óptima
         """
-        asignado = [False] * (self.tamano + 1)
-        asignacion = [0] * (self.tamano + 1)
-        ganancia = [0]  # Usar lista para modificar en función anidada
-        
         solucion = SolucionAsigna1a1(
             asignado=[0] * (self.tamano + 1),
             ganancia=0,
             soluciones_factibles=0
         )
         
-        def asignacion_exhaustiva(item: int):
-            """Función recursiva para explorar todas las asignaciones."""
-            for i in range(1, self.tamano + 1):
-                if not asignado[i]:
-                    asignado[i] = True
-                    asignacion[item] = i
-                    ganancia[0] += self.matriz[item][i]
-                    
-                    if item == self.tamano:
-                        solucion.soluciones_factibles += 1
-                        if ganancia[0] > solucion.ganancia:
-                            solucion.ganancia = ganancia[0]
-                            solucion.asignado = asignacion[:]
-                    else:
-                        asignacion_exhaustiva(item + 1)
-                    
-                    asignado[i] = False
-                    ganancia[0] -= self.matriz[item][i]
-        
-        asignacion_exhaustiva(1)
+        _ExhaustivaAsignacion(self.matriz, self.tamano, solucion).ejecutar()
         return solucion
         
     def busqueda_exhaustiva_ra(self) -> SolucionAsigna1a1:
@@ -108,87 +146,681 @@ class ProblemaAsigna1a1:
         Returns:
             La mejor solución encontrada.
         """
-        asignado = [False] * (self.tamano + 1)
-        asignacion = [0] * (self.tamano + 1)
-        ganancia_actual = [0]
-        
         solucion = SolucionAsigna1a1(
             asignado=[0] * (self.tamano + 1),
             ganancia=0,
             soluciones_factibles=0
         )
         
-        def calcular_cota_superior(nivel: int) -> int:
-            """
-            Calcula una cota superior optimista para la ganancia posible.
-            """
-            cota = ganancia_actual[0]
-            
-            for i in range(nivel, self.tamano + 1):
-                mejor_disponible = 0
-                for j in range(1, self.tamano + 1):
-                    if not asignado[j]:
-                        if self.matriz[i][j] > mejor_disponible:
-                            mejor_disponible = self.matriz[i][j]
-                cota += mejor_disponible
-            
-            return cota
+        self._ramificar(1, [0] * (self.tamano + 1),
+                        [False] * (self.tamano + 1), 0, solucion)
+        return solucion
+    
+    def _columnas_ordenadas(self) -> List[List[int]]:
+        """
+        Devuelve, para cada fila, sus columnas ordenadas por ganancia de
+        mayor a menor. Se calcula una sola vez por instancia.
+        """
+        if getattr(self, '_orden', None) is None:
+            self._orden = [[]] + [
+                sorted(range(1, self.tamano + 1),
+                       key=lambda j, fila=self.matriz[i]: fila[j],
+                       reverse=True)
+                for i in range(1, self.tamano + 1)
+            ]
+        return self._orden
+    
+    def _ramificar(self, inicio: int, asignacion: List[int],
+                   asignado: List[bool], ganancia: int,
+                   solucion: SolucionAsigna1a1) -> None:
+        """
+        Ramificación y acotamiento en profundidad a partir de una asignación
+        parcial de las filas 1..inicio-1.
         
-        def asignacion_ra(item: int):
-            """
-            Función recursiva con ramificación y acotamiento.
-            
-            Ordena las ramas (opciones de asignación) por su cota superior
-            de mayor a menor antes de explorarlas.
-            """
-            if item > self.tamano:
-                # Solución completa encontrada
-                solucion.soluciones_factibles += 1
-                if ganancia_actual[0] > solucion.ganancia:
-                    solucion.ganancia = ganancia_actual[0]
-                    solucion.asignado = asignacion.copy()
-                return
+        La cota de cada hijo suma, para cada fila pendiente, la mejor columna
+        libre. En lugar de recorrer la matriz en cada nodo, cada fila tiene
+        sus columnas ordenadas y un cursor a la primera columna libre; al
+        tomar o liberar una columna solo se mueven los cursores que apuntan
+        a ella, de modo que la cota de un nodo cuesta cerca de O(n).
+        
+        Args:
+            inicio: Primera fila sin asignar
+            asignacion: Columna asignada a cada fila (se modifica en sitio)
+            asignado: Columnas ocupadas (se modifica en sitio)
+            ganancia: Ganancia de la asignación parcial
+            solucion: Mejor solución conocida, se actualiza al mejorarla
+        """
+        _RamificacionAsignacion(self.matriz, self.tamano, self._columnas_ordenadas(),
+                                inicio, asignacion, asignado, ganancia,
+                                solucion).ejecutar()
+    
+    def busqueda_exhaustiva_ra_mejor_primero(
+            self, max_abiertos: int = 100000) -> SolucionAsigna1a1:
+        """
+        Ramificación y Acotamiento en orden "mejor primero".
+        
+        Parte de la solución obtenida al descender siempre por el hijo de
+        mejor cota. Mantiene una cola de prioridad de nodos abiertos y expande
+        el de mayor cota superior; la búsqueda termina cuando ningún nodo
+        abierto puede superar la mejor solución encontrada. La cola tiene un límite de nodos:
+        cuando se llena, los hijos que ya no caben se exploran en
+        profundidad (igual que busqueda_exhaustiva_ra) en lugar de
+        encolarse.
+        
+        Args:
+            max_abiertos: Máximo de nodos abiertos en la cola
+        
+        Returns:
+            Solución óptima
+        """
+        n = self.tamano
+        solucion = SolucionAsigna1a1(
+            asignado=[0] * (n + 1),
+            ganancia=0,
+            soluciones_factibles=0
+        )
+        
+        # Solución inicial: descenso siguiendo siempre al hijo de mejor cota
+        asignado = [False] * (n + 1)
+        for item in range(1, n + 1):
+            j, _ = max(self._cotas_hijos(item, asignado, solucion.ganancia),
+                       key=lambda x: x[1])
+            asignado[j] = True
+            solucion.asignado[item] = j
+            solucion.ganancia += self.matriz[item][j]
+        solucion.soluciones_factibles += 1
+        
+        # Cada nodo: (-cota, -nivel, -contador, nivel, asignacion, ganancia)
+        contador = 0
+        abiertos = [(-float('inf'), 0, contador, 1, [0] * (n + 1), 0)]
+        
+        while abiertos:
+            cota, _, _, item, asignacion, ganancia = heapq.heappop(abiertos)
+            if -cota <= solucion.ganancia:
+                break  # Ningún nodo abierto puede mejorar la solución
             
-            # OPTIMIZACIÓN: Calcular cotas para todas las opciones disponibles
-            opciones_con_cota = []
+            solucion.nodos_expandidos += 1
+            asignado = [False] * (n + 1)
+            for i in range(1, item):
+                asignado[asignacion[i]] = True
             
-            for j in range(1, self.tamano + 1):
-                if not asignado[j]:
-                    # Hacer asignación tentativa para calcular cota
+            for j, cota_hijo in self._cotas_hijos(item, asignado, ganancia):
+                if cota_hijo <= solucion.ganancia:
+                    continue
+                
+                hijo = asignacion.copy()
+                hijo[item] = j
+                ganancia_hijo = ganancia + self.matriz[item][j]
+                
+                if item == n:
+                    # Solución completa: se evalúa sin encolarla
+                    solucion.soluciones_factibles += 1
+                    solucion.ganancia = ganancia_hijo
+                    solucion.asignado = hijo
+                elif len(abiertos) < max_abiertos:
+                    contador += 1
+                    heapq.heappush(abiertos, (-cota_hijo, -item, -contador,
+                                              item + 1, hijo, ganancia_hijo))
+                else:
+                    # Cola llena: explorar este hijo en profundidad
                     asignado[j] = True
-                    asignacion[item] = j
-                    ganancia_actual[0] += self.matriz[item][j]
-                    
-                    # Calcular cota con esta asignación
-                    cota = calcular_cota_superior(item + 1)
-                    
-                    # Guardar opción con su cota
-                    opciones_con_cota.append((j, cota))
-                    
-                    # Deshacer asignación temporal
+                    self._ramificar(item + 1, hijo, asignado,
+                                    ganancia_hijo, solucion)
                     asignado[j] = False
-                    ganancia_actual[0] -= self.matriz[item][j]
+        
+        return solucion
+    
+    def _cotas_hijos(self, item: int, asignado: List[bool],
+                     ganancia: int) -> List[Tuple[int, int]]:
+        """
+        Calcula la cota superior de cada columna libre para la fila item,
+        con la misma cota que _ramificar pero sin cursores persistentes.
+        
+        Args:
+            item: Fila que se va a asignar
+            asignado: Columnas ocupadas
+            ganancia: Ganancia de la asignación parcial
+        
+        Returns:
+            Lista de pares (columna, cota)
+        """
+        n = self.tamano
+        return _cotas_columnas(self.matriz, self._columnas_ordenadas(), n,
+                               item, asignado, ganancia, [0] * (n + 1))
+    
+    def busqueda_programacion_dinamica(self) -> SolucionAsigna1a1:
+        """
+        Programación dinámica sobre subconjuntos en O(n·2ⁿ).
+        
+        mejor[mask] es la mayor ganancia al asignar las filas 1..k, con
+        k = número de bits de mask, exactamente a las columnas de mask.
+        Las tablas son arreglos tipados (8 bytes por estado para la
+        ganancia y 1 byte para la columna elegida), de modo que 2²² estados
+        caben en unos 38 MB. Pensado para n ≤ 22 aproximadamente.
+        
+        Returns:
+            Solución óptima
+        """
+        n = self.tamano
+        if n > 25:
+            raise ValueError("La programación dinámica por subconjuntos "
+                             "solo admite tamaños de hasta 25")
+        
+        total = 1 << n
+        mejor = array('q', bytes(8 * total))
+        eleccion = array('b', bytes(total))   # Columna de la última fila
+        
+        for mask in range(1, total):
+            fila = self.matriz[mask.bit_count()]
+            valor_mask = None
+            resto = mask
+            while resto:
+                bit = resto & -resto
+                resto ^= bit
+                j = bit.bit_length()
+                valor = mejor[mask ^ bit] + fila[j]
+                if valor_mask is None or valor > valor_mask:
+                    valor_mask = valor
+                    columna = j
+            mejor[mask] = valor_mask
+            eleccion[mask] = columna
+        
+        # Reconstruir la asignación desde el conjunto completo
+        solucion = SolucionAsigna1a1(
+            asignado=[0] * (n + 1),
+            ganancia=mejor[total - 1]
+        )
+        mask = total - 1
+        for i in range(n, 0, -1):
+            j = eleccion[mask]
+            solucion.asignado[i] = j
+            mask ^= 1 << (j - 1)
+        
+        return solucion
+    
+    def busqueda_caminos_aumentantes(self) -> SolucionAsigna1a1:
+        """
+        Caminos aumentantes más cortos sobre una matriz dispersa.
+        
+        Admite matrices rectangulares con parejas prohibidas. Cada fila se
+        inserta con un Dijkstra (con montículo) sobre los costos reducidos
+        de las aristas permitidas, y solo se actualizan los potenciales de
+        los nodos alcanzados, por lo que memoria y tiempo dependen del número
+        de aristas y no de filas × columnas.
+        
+        Dejar una fila sin asignar (columna 0) vale 0: cada fila tiene una
+        columna ficticia propia con ganancia 0, así una fila nueva siempre
+        encuentra camino y puede desplazar a otra que rinde menos. La
+        solución es de ganancia máxima aunque no todas las filas quepan.
+        
+        Returns:
+            Solución con asignado[i] = columna de la fila i (0 si ninguna)
+        """
+        dispersa = self.matriz
+        if not isinstance(dispersa, MatrizDispersa):
+            dispersa = MatrizDispersa.desde_densa(self.matriz, self.tamano)
+        
+        filas = dispersa.filas
+        columnas = dispersa.columnas
+        inicio = dispersa.inicio
+        columna = dispersa.columna
+        ganancia = dispersa.ganancia
+        
+        # La columna ficticia de la fila i es columnas + i (ganancia 0)
+        total = columnas + filas
+        
+        # Costo = -ganancia; costo reducido = costo + pot_fila - pot_col >= 0
+        pot_fila = [0] * (filas + 1)
+        pot_col = [0] * (total + 1)
+        fila_de = [0] * (total + 1)               # Fila asignada a la columna
+        col_de = [0] * (filas + 1)                # Columna asignada a la fila
+        arista_de = [-1] * (filas + 1)            # Arista usada (-1: ficticia)
+        
+        for i in range(1, filas + 1):
+            if inicio[i] < inicio[i + 1]:
+                pot_fila[i] = max(0, max(ganancia[inicio[i]:inicio[i + 1]]))
+        
+        for s in range(1, filas + 1):
+            if inicio[s] == inicio[s + 1]:
+                continue    # Solo tiene su columna ficticia
             
-            # ORDENAR: Explorar primero las ramas con mejor cota (mayor a menor)
-            opciones_con_cota.sort(key=lambda x: x[1], reverse=True)
+            distancia = {}      # Distancia tentativa a cada columna
+            previa = {}         # Arista por la que se alcanzó la columna
+            fijas = []          # Columnas con distancia definitiva
+            cerradas = set()
+            monticulo = []
             
-            # Explorar opciones en orden de mejor a peor cota
-            for j, cota in opciones_con_cota:
-                # PODA TEMPRANA: Si esta cota no puede mejorar, las siguientes tampoco
-                if cota <= solucion.ganancia:
-                    break  # Las siguientes serán peores, no vale la pena explorarlas
+            fila, d_fila = s, 0
+            while True:
+                base = d_fila + pot_fila[fila]
+                for k in range(inicio[fila], inicio[fila + 1]):
+                    j = columna[k]
+                    if j in cerradas:
+                        continue
+                    nd = base - ganancia[k] - pot_col[j]
+                    if nd < distancia.get(j, nd + 1):
+                        distancia[j] = nd
+                        previa[j] = (fila, k)
+                        heapq.heappush(monticulo, (nd, j))
                 
-                # Hacer asignación
-                asignado[j] = True
-                asignacion[item] = j
-                ganancia_actual[0] += self.matriz[item][j]
+                # Columna ficticia de la fila (quedar sin asignar)
+                j = columnas + fila
+                nd = base - pot_col[j]
+                if j not in cerradas and nd < distancia.get(j, nd + 1):
+                    distancia[j] = nd
+                    previa[j] = (fila, -1)
+                    heapq.heappush(monticulo, (nd, j))
                 
-                # Recursión
-                asignacion_ra(item + 1)
+                # Siguiente columna más cercana todavía no cerrada; la
+                # ficticia de s garantiza que el montículo no se agota
+                while True:
+                    d_col, j = heapq.heappop(monticulo)
+                    if j not in cerradas and d_col == distancia[j]:
+                        break
                 
-                # Backtrack
+                cerradas.add(j)
+                fijas.append(j)
+                if fila_de[j] == 0:
+                    destino = j
+                    break
+                fila, d_fila = fila_de[j], d_col
+            
+            # Ajustar potenciales de los nodos alcanzados
+            d_final = distancia[destino]
+            pot_fila[s] -= d_final
+            for j in fijas:
+                pot_col[j] += distancia[j] - d_final
+                if j != destino:
+                    pot_fila[fila_de[j]] += distancia[j] - d_final
+            
+            # Aumentar a lo largo del camino
+            j = destino
+            while True:
+                i, k = previa[j]
+                anterior = col_de[i]
+                col_de[i] = j
+                arista_de[i] = k
+                fila_de[j] = i
+                if i == s:
+                    break
+                j = anterior
+        
+        asignado = [j if j <= columnas else 0 for j in col_de]
+        return SolucionAsigna1a1(
+            asignado=asignado,
+            ganancia=sum(ganancia[arista_de[i]]
+                         for i in range(1, filas + 1) if asignado[i])
+        )
+    
+    def busqueda_hungaro(self) -> SolucionAsigna1a1:
+        """
+        Método Húngaro (Kuhn-Munkres) en O(n³).
+        
+        Trabaja sobre costos negados (maximizar la ganancia equivale a
+        minimizar su negativo) y mantiene un potencial dual por columna.
+        Cada fila se inserta con una búsqueda de camino aumentante tipo
+        Dijkstra sobre los costos reducidos. Los potenciales y el
+        emparejamiento quedan guardados para resolver().
+        
+        Returns:
+            Solución óptima
+        """
+        n = self.tamano
+        v = [0] * (n + 1)       # Potencial de cada columna
+        p = [0] * (n + 1)       # p[j]: fila asignada a la columna j
+        fila_asignada = [False] * (n + 1)
+        
+        # Reducción por columnas: cada columna toma como potencial su mejor
+        # ganancia y se asigna a esa fila si todavía está libre.
+        for j in range(1, n + 1):
+            mejor = max(range(1, n + 1), key=lambda i: self.matriz[i][j])
+            v[j] = -self.matriz[mejor][j]
+            if not fila_asignada[mejor]:
+                fila_asignada[mejor] = True
+                p[j] = mejor
+        
+        for i in range(1, n + 1):
+            if not fila_asignada[i]:
+                self._fase_hungaro(i, v, p)
+        
+        self._duales = v
+        self._emparejamiento = p
+        self._filas_modificadas = set()
+        return self._solucion_hungaro()
+    
+    def actualizar(self, i: int, j: int, valor: int) -> None:
+        """
+        Cambia la ganancia matriz[i][j] y marca la fila i para que
+        resolver() la vuelva a insertar.
+        
+        Args:
+            i: Fila
+            j: Columna
+            valor: Nueva ganancia
+        """
+        self.matriz[i][j] = valor
+        
+        if getattr(self, '_orden', None) is not None:
+            fila = self.matriz[i]
+            self._orden[i].sort(key=lambda k: fila[k], reverse=True)
+        if getattr(self, '_duales', None) is not None:
+            self._filas_modificadas.add(i)
+    
+    def resolver(self) -> SolucionAsigna1a1:
+        """
+        Resuelve con el método húngaro reutilizando los potenciales y el
+        emparejamiento de la solución anterior.
+        
+        Solo las filas modificadas con actualizar() se retiran del
+        emparejamiento y se vuelven a insertar, con una fase O(n²) cada una.
+        Si no hay solución previa, hace la búsqueda completa.
+        
+        Returns:
+            Solución óptima
+        """
+        if getattr(self, '_duales', None) is None:
+            return self.busqueda_hungaro()
+        
+        p = self._emparejamiento
+        for j in range(1, self.tamano + 1):
+            if p[j] in self._filas_modificadas:
+                p[j] = 0
+        for i in sorted(self._filas_modificadas):
+            self._fase_hungaro(i, self._duales, p)
+        
+        self._filas_modificadas.clear()
+        return self._solucion_hungaro()
+    
+    def _solucion_hungaro(self) -> SolucionAsigna1a1:
+        """Construye la solución a partir del emparejamiento guardado."""
+        p = self._emparejamiento
+        solucion = SolucionAsigna1a1(
+            asignado=[0] * (self.tamano + 1),
+            ganancia=0
+        )
+        for j in range(1, self.tamano + 1):
+            if p[j]:
+                solucion.asignado[p[j]] = j
+                solucion.ganancia += self.matriz[p[j]][j]
+        
+        return solucion
+    
+    def _fase_hungaro(self, i: int, v: List[int], p: List[int]) -> None:
+        """
+        Inserta la fila i en el emparejamiento mediante el camino aumentante
+        de costo reducido mínimo y ajusta los potenciales de las columnas.
+        
+        Args:
+            i: Fila a insertar (no debe estar asignada)
+            v: Potenciales de las columnas
+            p: Fila asignada a cada columna (0 si está libre)
+        """
+        n = self.tamano
+        matriz = self.matriz
+        
+        # d[j]: costo reducido del mejor camino desde la fila i hasta j
+        fila = matriz[i]
+        d = [0] * (n + 1)
+        for j in range(1, n + 1):
+            d[j] = -fila[j] - v[j]
+        way = [0] * (n + 1)     # Columna previa en el camino (0 = fila i)
+        
+        libres = list(range(1, n + 1))
+        escaneadas = []
+        
+        while True:
+            j = min(libres, key=d.__getitem__)
+            libres.remove(j)
+            escaneadas.append(j)
+            if p[j] == 0:
+                break
+            
+            # Extender el camino a través de la fila asignada a j
+            fila = matriz[p[j]]
+            base = d[j] + fila[j] + v[j]
+            for k in libres:
+                nd = base - fila[k] - v[k]
+                if nd < d[k]:
+                    d[k] = nd
+                    way[k] = j
+        
+        # Actualizar potenciales de las columnas alcanzadas
+        dj = d[j]
+        for k in escaneadas:
+            v[k] += d[k] - dj
+        
+        # Recorrer el camino aumentante en sentido inverso
+        while True:
+            previa = way[j]
+            if previa == 0:
+                p[j] = i
+                break
+            p[j] = p[previa]
+            j = previa
+
+
+def _cotas_columnas(matriz: List[List[int]], orden: List[List[int]],
+                    tamano: int, item: int, asignado: List[bool],
+                    ganancia: int, cursor: List[int]) -> List[Tuple[int, int]]:
+    """
+    Cota superior de cada columna libre para la fila item: la ganancia
+    actual, más la mejor columna libre de cada fila pendiente, menos lo que
+    baja esa suma si la columna tomada era la mejor de alguna fila.
+    
+    Args:
+        matriz: Matriz de ganancias
+        orden: Columnas de cada fila de mayor a menor ganancia
+        tamano: Número de filas y columnas
+        item: Fila que se va a asignar
+        asignado: Columnas ocupadas
+        ganancia: Ganancia de la asignación parcial
+        cursor: Posición en orden[i] desde la que buscar la mejor columna
+            libre de cada fila pendiente i (0: desde el principio)
+    
+    Returns:
+        Lista de pares (columna, cota)
+    """
+    suma_mejores = 0
+    perdida = [0] * (tamano + 1)
+    for i in range(item + 1, tamano + 1):
+        orden_fila = orden[i]
+        fila = matriz[i]
+        c = cursor[i]
+        while asignado[orden_fila[c]]:
+            c += 1
+        mejor = orden_fila[c]
+        c += 1
+        while asignado[orden_fila[c]]:
+            c += 1
+        suma_mejores += fila[mejor]
+        perdida[mejor] += fila[mejor] - fila[orden_fila[c]]
+    
+    base = ganancia + suma_mejores
+    fila = matriz[item]
+    return [(j, base + fila[j] - perdida[j])
+            for j in range(1, tamano + 1) if not asignado[j]]
+
+
+class _ExhaustivaAsignacion(MotorBacktracking):
+    """
+    Recorre todas las asignaciones: el nivel item prueba, en orden, cada
+    columna libre para la fila item. opcion[item] es la próxima columna a
+    probar. Las hojas (nivel tamano + 1) se evalúan al generarlas desde el
+    último nivel, sin apilarlas.
+    """
+    
+    def __init__(self, matriz: List[List[int]], tamano: int,
+                 solucion: SolucionAsigna1a1):
+        super().__init__(1, tamano)
+        self.matriz = matriz
+        self.tamano = tamano
+        self.solucion = solucion
+        self.asignado = [False] * (tamano + 1)
+        self.asignacion = [0] * (tamano + 1)
+        self.ganancia = 0
+        self.opcion[1] = 1
+        if tamano == 0:
+            # La raíz ya es la única hoja
+            solucion.soluciones_factibles += 1
+            self.nivel = 0
+    
+    def _recorrer(self, limite: int) -> int:
+        matriz = self.matriz
+        n = self.tamano
+        solucion = self.solucion
+        asignado = self.asignado
+        asignacion = self.asignacion
+        opcion = self.opcion
+        nivel = self.nivel
+        ganancia = self.ganancia
+        visitados = 0
+        
+        while visitados < limite:
+            j = opcion[nivel]
+            while j <= n and asignado[j]:
+                j += 1
+            
+            if j > n:
+                # Fila agotada: volver a la anterior y liberar su columna
+                nivel -= 1
+                if nivel < 1:
+                    break
+                c = asignacion[nivel]
+                asignado[c] = False
+                ganancia -= matriz[nivel][c]
+                continue
+            
+            opcion[nivel] = j + 1
+            visitados += 1
+            if nivel == n:
+                solucion.soluciones_factibles += 1
+                if ganancia + matriz[n][j] > solucion.ganancia:
+                    asignacion[n] = j
+                    solucion.ganancia = ganancia + matriz[n][j]
+                    solucion.asignado = asignacion[:]
+                continue
+            
+            asignado[j] = True
+            asignacion[nivel] = j
+            ganancia += matriz[nivel][j]
+            nivel += 1
+            opcion[nivel] = 1
+        
+        self.nivel = nivel
+        self.ganancia = ganancia
+        return visitados
+
+
+class _RamificacionAsignacion(MotorBacktracking):
+    """
+    Ramificación y acotamiento en profundidad a partir de una asignación
+    parcial de las filas 1..inicio-1 (ver ProblemaAsigna1a1._ramificar).
+    
+    self.nivel siempre apunta a un nodo recién generado. Por nivel se
+    guardan las opciones del nodo ordenadas por cota, el índice
+    opcion[item] de la siguiente y los cursores que movió la columna
+    tomada, para restaurarlos al volver.
+    """
+    
+    def __init__(self, matriz: List[List[int]], tamano: int,
+                 orden: List[List[int]], inicio: int, asignacion: List[int],
+                 asignado: List[bool], ganancia: int,
+                 solucion: SolucionAsigna1a1):
+        n = tamano
+        super().__init__(inicio, n + 1)
+        self.matriz = matriz
+        self.tamano = n
+        self.orden = orden
+        self.asignacion = asignacion
+        self.asignado = asignado
+        self.ganancia = ganancia
+        self.solucion = solucion
+        self.opciones: List[List[Tuple[int, int]]] = [[]] * (n + 2)
+        self.movidos: List[List[Tuple[int, int]]] = [[]] * (n + 2)
+        
+        # cursor[i]: posición en orden[i] de la mejor columna libre
+        self.cursor = [0] * (n + 1)
+        for i in range(inicio, n + 1):
+            c = 0
+            while asignado[orden[i][c]]:
+                c += 1
+            self.cursor[i] = c
+    
+    def _recorrer(self, limite: int) -> int:
+        matriz = self.matriz
+        n = self.tamano
+        orden = self.orden
+        asignacion = self.asignacion
+        asignado = self.asignado
+        solucion = self.solucion
+        opciones = self.opciones
+        movidos = self.movidos
+        cursor = self.cursor
+        opcion = self.opcion
+        base = self.nivel_inicial
+        nivel = self.nivel
+        ganancia = self.ganancia
+        visitados = 0
+        
+        while visitados < limite:
+            if nivel > n:
+                # Solución completa encontrada
+                solucion.soluciones_factibles += 1
+                if ganancia > solucion.ganancia:
+                    solucion.ganancia = ganancia
+                    solucion.asignado = asignacion.copy()
+                lista = []
+            else:
+                solucion.nodos_expandidos += 1
+                
+                # Cota de cada opción disponible, de mayor a menor; los
+                # cursores ya apuntan a la mejor columna libre de cada fila
+                lista = _cotas_columnas(matriz, orden, n, nivel, asignado,
+                                        ganancia, cursor)
+                lista.sort(key=itemgetter(1), reverse=True)
+            opciones[nivel] = lista
+            k = 0
+            
+            # Siguiente rama: la próxima opción de este nivel o, si se
+            # agotaron, volver al anterior soltando su columna
+            while True:
+                lista = opciones[nivel]
+                # PODA TEMPRANA: si esta cota no puede mejorar, las siguientes tampoco
+                if k < len(lista) and lista[k][1] > solucion.ganancia:
+                    break
+                nivel -= 1
+                if nivel < base:
+                    break
+                j = asignacion[nivel]
                 asignado[j] = False
-                ganancia_actual[0] -= self.matriz[item][j]
+                ganancia -= matriz[nivel][j]
+                for i, c in movidos[nivel]:
+                    cursor[i] = c
+                k = opcion[nivel]
+            if nivel < base:
+                break
+            
+            opcion[nivel] = k + 1
+            j = lista[k][0]
+            
+            # Tomar la columna j y avanzar los cursores que apuntan a ella
+            asignado[j] = True
+            asignacion[nivel] = j
+            ganancia += matriz[nivel][j]
+            movido = []
+            for i in range(nivel + 1, n + 1):
+                orden_fila = orden[i]
+                c = cursor[i]
+                if orden_fila[c] == j:
+                    movido.append((i, c))
+                    c += 1
+                    while asignado[orden_fila[c]]:
+                        c += 1
+                    cursor[i] = c
+            movidos[nivel] = movido
+            nivel += 1
+            visitados += 1
         
-        asignacion_ra(1)
-        return solucion
\ No newline at end of file
+        self.nivel = nivel
+        self.ganancia = ganancia
+        return visitados
@@ -0,0 +1,77 @@
+"""
+busqueda.py
+
+Base compartida por las búsquedas exhaustivas (backtracking) iterativas.
+"""
+
+import sys
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+
+class MotorBacktracking(ABC):
+    """
+    Recorrido en profundidad con una pila explícita y preasignada.
+
+    Cada búsqueda es una subclase que guarda su estado en arreglos
+    indexados por nivel: opcion[nivel] es el cursor de la próxima rama a
+    probar en ese nivel, y lo que una rama cambia se deshace al volver a
+    su nivel. La subclase implementa _recorrer(limite) como un único ciclo
+    while que sube y baja de nivel moviendo esos cursores, sin llamadas ni
+    generadores por nodo.
+
+    La base solo aporta ejecutar() y el arreglo opcion: cada subclase es
+    dueña de su recorrido completo, incluido el paso de retroceso (nivel
+    agotado: nivel -= 1, deshacer la rama de ese nivel y terminar si queda
+    por debajo de nivel_inicial). Ese paso se escribe en línea en cada
+    _recorrer porque deshacer toca variables locales del ciclo (ganancia,
+    peso, costo...) que un método de la base no ve sin pasar por el objeto
+    en cada nodo.
+
+    Como no se usa la pila de Python no existe el límite de recursión, y
+    la búsqueda puede pausarse y reanudarse llamando de nuevo a ejecutar():
+    todo lo necesario para continuar queda en el objeto.
+    """
+
+    def __init__(self, nivel_inicial: int, nivel_maximo: int):
+        """
+        Inicializa el motor con la raíz en nivel_inicial.
+
+        Args:
+            nivel_inicial: Nivel de la raíz
+            nivel_maximo: Nivel más profundo que puede apilarse
+        """
+        self.nivel_inicial = nivel_inicial
+        self.nivel = nivel_inicial
+        self.opcion: List[int] = [0] * (nivel_maximo + 2)
+        self.nodos = 1          # La raíz
+        self.terminado = False
+
+    def ejecutar(self, limite: Optional[int] = None) -> bool:
+        """
+        Avanza la búsqueda.
+
+        Args:
+            limite: Nodos a visitar en esta llamada antes de pausar (None:
+                sin límite); puede pasarse por las pocas hojas que se evalúan
+                juntas
+
+        Returns:
+            True si la búsqueda terminó, False si se pausó por el límite
+        """
+        # Una raíz que ya es hoja o está podada deja nivel < nivel_inicial
+        if not self.terminado and self.nivel >= self.nivel_inicial:
+            self.nodos += self._recorrer(sys.maxsize if limite is None else limite)
+        self.terminado = self.nivel < self.nivel_inicial
+        return self.terminado
+
+    @abstractmethod
+    def _recorrer(self, limite: int) -> int:
+        """
+        Avanza desde self.nivel hasta agotar el árbol o visitar al menos
+        limite nodos. Al terminar deja self.nivel < nivel_inicial; al pausar
+        guarda en el objeto el estado que tenga en variables locales.
+
+        Returns:
+            Nodos visitados en esta llamada
+        """
@@ -1,6 +1,18 @@
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import List
+from itertools import compress
+from typing import List, Tuple
 from tiempo import MedidorTiempo
+from busqueda import MotorBacktracking
+
+try:
+    import numpy as np
+except ImportError:     # numpy es opcional: solo lo usa la búsqueda vectorizada
+    np = None
+
+# Convierte bytes 0/1 en los caracteres '0'/'1' para empaquetar bits con int()
+_A_BINARIO = bytes.maketrans(b'\x00\x01', b'01')
 
 @dataclass
 class SolucionMochila:
@@ -13,18 +25,24 @@ class SolucionMochila:
         peso_total --> Peso total de los ítems seleccionados.
         soluciones_factibles --> Cantidad de soluciones evaluadas.
         tiempo --> Duración del cálculo usando MedidorTiempo.
+        cota_superior --> Beneficio óptimo máximo garantizado (métodos aproximados).
     """
     seleccionados: List[int]
     beneficio: int
     peso_total: int
     soluciones_factibles: int = 0
     tiempo: str = ""
+    cota_superior: int = 0
 
 class ProblemaMochila:
     """
     Representa una instancia del problema de la mochila 0-1.
     """
 
+    # La tabla de máscaras de la búsqueda vectorizada ocupa 2^b x b enteros
+    # de 8 bytes: con b = 20 ya son 160 MB
+    MAX_BITS_BLOQUE = 20
+
     def __init__(self, peso, beneficio, capacidad, n):
 
         if peso[0] != 0:
@@ -36,6 +54,10 @@ class ProblemaMochila:
         self.beneficio = beneficio
         self.capacidad = capacidad
         self.n = n
+        self._tabla = None          # (capacidad, valores, decisiones) de preparar_capacidades
+
+        # Suma de subconjuntos: el beneficio de cada ítem es su peso
+        self.es_suma_subconjuntos = all(peso[i] == beneficio[i] for i in range(1, n + 1))
 
     def busqueda_greedy(self) -> SolucionMochila:
         """
@@ -71,48 +93,106 @@ class ProblemaMochila:
             tiempo=reloj.formato_tiempo(tiempo)
         )
 
-    def busqueda_exhaustiva_pura(self) -> SolucionMochila:
+    def busqueda_exhaustiva_pura(self, vectorizada: bool = False,
+                                 bits_bloque: int = 16) -> SolucionMochila:
         """
         Búsqueda exhaustiva pura.
         Evalua las combinaciones posibles de ítems en la mochila.
+
+        Args:
+            vectorizada: Evalúa los subconjuntos por bloques con numpy
+            bits_bloque: Ítems enumerados dentro de cada bloque (2^bits
+                subconjuntos), de 0 a MAX_BITS_BLOQUE
         """
-        
+        if vectorizada:
+            return self._exhaustiva_vectorizada(bits_bloque)
+
         # Inicia cronómetro
         reloj = MedidorTiempo()
         reloj.cargar_tiempo()
         
-        mejor_beneficio = 0
-        mejor_sol = []
-        soluciones_factibles = 0
-        
-        def backtrack(i, peso_actual, beneficio_actual, seleccionados):
-            """
-            Backtracking estándar sin podas.
-            i: índice del ítem actual.
-            """
-            nonlocal mejor_beneficio, mejor_sol, soluciones_factibles
-            
-            if i > self.n:
-                soluciones_factibles += 1
-                if beneficio_actual > mejor_beneficio:
-                    mejor_beneficio = beneficio_actual
-                    mejor_sol = seleccionados[:]
-                return
-
-            backtrack(i + 1, peso_actual, beneficio_actual, seleccionados)
-            
-            if peso_actual + self.peso[i] <= self.capacidad:
-                seleccionados.append(i)
-                backtrack(i + 1,
-                          peso_actual + self.peso[i],
-                          beneficio_actual + self.beneficio[i],
-                          seleccionados)
-                seleccionados.pop()
-        
-        backtrack(1, 0, 0, [])
+        busqueda = _ExhaustivaMochila(self.peso, self.beneficio, self.capacidad, self.n)
+        busqueda.ejecutar()
+        mejor_sol = busqueda.seleccionados()
         
         tiempo = reloj.intervalo_tiempo()
         
+        return SolucionMochila(
+            seleccionados=mejor_sol,
+            beneficio=busqueda.mejor_beneficio,
+            peso_total=sum(self.peso[i] for i in mejor_sol),
+            soluciones_factibles=busqueda.soluciones_factibles,
+            tiempo=reloj.formato_tiempo(tiempo)
+        )
+
+    def _exhaustiva_vectorizada(self, bits_bloque: int) -> SolucionMochila:
+        """
+        Enumeración exhaustiva por bloques de máscaras de bits.
+
+        Los primeros b = bits_bloque ítems forman una tabla fija de 2^b
+        subconjuntos cuyos pesos y beneficios salen de un producto de
+        matrices (máscaras de 2^b x b por el vector de pesos). Los demás
+        ítems se recorren en código Gray: entre un bloque y el siguiente
+        cambia un solo ítem, así que el peso y beneficio del bloque se
+        actualizan en O(1) y cada bloque se evalúa con operaciones de numpy
+        sobre la tabla completa.
+
+        soluciones_factibles cuenta, igual que la búsqueda recursiva, los
+        subconjuntos que caben en la mochila.
+        """
+        if np is None:
+            raise ImportError("La búsqueda vectorizada requiere numpy")
+        if not 0 <= bits_bloque <= self.MAX_BITS_BLOQUE:
+            raise ValueError(f"bits_bloque debe estar entre 0 y "
+                             f"{self.MAX_BITS_BLOQUE}: {bits_bloque}")
+
+        reloj = MedidorTiempo()
+        reloj.cargar_tiempo()
+
+        b = min(bits_bloque, self.n)
+        altos = self.n - b
+
+        mascaras = (np.arange(1 << b)[:, None] >> np.arange(b)) & 1
+        pesos_bajos = mascaras @ np.array(self.peso[1:b + 1], dtype=np.int64)
+        beneficios_bajos = mascaras @ np.array(self.beneficio[1:b + 1], dtype=np.int64)
+        maximo_bajo = int(beneficios_bajos.max())
+
+        mejor_beneficio = 0
+        mejor = (0, 0)              # (máscara de la tabla, máscara de los altos)
+        soluciones_factibles = 0
+
+        peso_alto = 0
+        beneficio_alto = 0
+        mascara_alta = 0
+        for g in range(1 << altos):
+            if g:
+                # El código Gray g cambia el bit de su cero final más bajo
+                bit = (g & -g).bit_length() - 1
+                mascara_alta ^= 1 << bit
+                i = b + 1 + bit
+                signo = 1 if mascara_alta >> bit & 1 else -1
+                peso_alto += signo * self.peso[i]
+                beneficio_alto += signo * self.beneficio[i]
+
+            restante = self.capacidad - peso_alto
+            if restante < 0:
+                continue
+
+            factibles = pesos_bajos <= restante
+            soluciones_factibles += int(np.count_nonzero(factibles))
+
+            if beneficio_alto + maximo_bajo > mejor_beneficio:
+                candidatos = np.where(factibles, beneficios_bajos, -1)
+                k = int(candidatos.argmax())
+                if beneficio_alto + int(candidatos[k]) > mejor_beneficio:
+                    mejor_beneficio = beneficio_alto + int(candidatos[k])
+                    mejor = (k, mascara_alta)
+
+        mejor_sol = [i for i in range(1, b + 1) if mejor[0] >> (i - 1) & 1]
+        mejor_sol += [i for i in range(b + 1, self.n + 1) if mejor[1] >> (i - b - 1) & 1]
+
+        tiempo = reloj.intervalo_tiempo()
+
         return SolucionMochila(
             seleccionados=mejor_sol,
             beneficio=mejor_beneficio,
@@ -130,64 +210,334 @@ class ProblemaMochila:
         reloj = MedidorTiempo()
         reloj.cargar_tiempo()
         
-        mejor_beneficio = 0
-        mejor_sol = []
-        soluciones_factibles = 0
+        busqueda = _RamificacionMochila(self.peso, self.beneficio, self.capacidad, self.n)
+        busqueda.ejecutar()
+        mejor_sol = busqueda.seleccionados()
         
-        objetos = list(range(1, self.n + 1))
-        objetos.sort(key=lambda i: self.beneficio[i] / self.peso[i], reverse=True)
+        tiempo = reloj.intervalo_tiempo()
         
-        def cota_superior(indice, peso_actual, beneficio_actual):
-            """
-            Calcula la cota superior.
-            Sirve para decidir si una rama debe podarse.
-            """
-            restante = self.capacidad - peso_actual
-            cota = beneficio_actual
-            
-            for j in range(indice, self.n):
-                obj = objetos[j]
-                if self.peso[obj] <= restante:
-                    cota += self.beneficio[obj]
-                    restante -= self.peso[obj]
+        return SolucionMochila(
+            seleccionados=mejor_sol,
+            beneficio=busqueda.mejor_beneficio,
+            peso_total=sum(self.peso[i] for i in mejor_sol),
+            soluciones_factibles=busqueda.soluciones_factibles,
+            tiempo=reloj.formato_tiempo(tiempo)
+        )
+
+    def busqueda_programacion_dinamica(self) -> SolucionMochila:
+        """
+        Programación dinámica pseudo-polinomial en O(n·capacidad).
+
+        Usa un único arreglo de valores que se actualiza ítem por ítem y,
+        por cada ítem, un entero cuyos bits marcan las capacidades en que
+        conviene tomarlo (unos n·C/8 bytes en total) para reconstruir los
+        seleccionados.
+
+        Si la instancia es de suma de subconjuntos (beneficio == peso) usa
+        en su lugar el conjunto de bits de _suma_subconjuntos.
+        """
+        reloj = MedidorTiempo()
+        reloj.cargar_tiempo()
+
+        if self.es_suma_subconjuntos:
+            seleccionados = self._suma_subconjuntos(self.capacidad)
+            beneficio = sum(self.beneficio[i] for i in seleccionados)
+        else:
+            valores, decisiones = self._tabla_dp(self.capacidad)
+            seleccionados = self._reconstruir_dp(decisiones, self.capacidad)
+            beneficio = valores[self.capacidad]
+
+        tiempo = reloj.intervalo_tiempo()
+
+        return SolucionMochila(
+            seleccionados=seleccionados,
+            beneficio=beneficio,
+            peso_total=sum(self.peso[i] for i in seleccionados),
+            tiempo=reloj.formato_tiempo(tiempo)
+        )
+
+    def preparar_capacidades(self, capacidad_maxima: int) -> None:
+        """
+        Calcula una sola vez la programación dinámica hasta capacidad_maxima
+        y la guarda en la instancia para responder resolver_capacidad(c)
+        con cualquier c <= capacidad_maxima.
+
+        Args:
+            capacidad_maxima: Mayor capacidad que se va a consultar
+        """
+        valores, decisiones = self._tabla_dp(capacidad_maxima)
+        self._tabla = (capacidad_maxima, valores, decisiones)
+
+    def resolver_capacidad(self, capacidad: int) -> SolucionMochila:
+        """
+        Responde el problema con otra capacidad usando la tabla guardada:
+        O(1) para el beneficio y O(n) para reconstruir los seleccionados.
+        Si no hay tabla o no alcanza, se prepara hasta esta capacidad.
+
+        Args:
+            capacidad: Capacidad a consultar
+        """
+        reloj = MedidorTiempo()
+        reloj.cargar_tiempo()
+
+        if capacidad < 0:
+            raise ValueError("La capacidad no puede ser negativa")
+        if self._tabla is None or capacidad > self._tabla[0]:
+            self.preparar_capacidades(capacidad)
+
+        _, valores, decisiones = self._tabla
+        seleccionados = self._reconstruir_dp(decisiones, capacidad)
+
+        tiempo = reloj.intervalo_tiempo()
+
+        return SolucionMochila(
+            seleccionados=seleccionados,
+            beneficio=valores[capacidad],
+            peso_total=sum(self.peso[i] for i in seleccionados),
+            tiempo=reloj.formato_tiempo(tiempo)
+        )
+
+    def liberar_tabla(self) -> None:
+        """Libera la tabla guardada por preparar_capacidades."""
+        self._tabla = None
+
+    def busqueda_encuentro_en_el_medio(self) -> SolucionMochila:
+        """
+        Búsqueda exacta "encuentro en el medio" en O(2^(n/2)·n).
+
+        Divide los ítems en dos mitades y enumera los subconjuntos factibles
+        de cada una en arreglos tipados (24 bytes por subconjunto). La
+        segunda mitad se ordena por peso con una permutación de índices y se
+        queda solo con los subconjuntos no dominados (más peso implica más
+        beneficio); para cada subconjunto de la primera mitad, una búsqueda
+        binaria da el mejor complemento que cabe. No depende de la
+        capacidad, así que sirve para pesos muy grandes; la memoria crece
+        como 2^(n/2), de modo que el límite práctico ronda los 40 a 44 ítems
+        (unos 2²² subconjuntos por mitad).
+
+        soluciones_factibles cuenta los subconjuntos enumerados en ambas
+        mitades.
+        """
+        reloj = MedidorTiempo()
+        reloj.cargar_tiempo()
+
+        mitad = self.n // 2
+        primera = self._enumerar_subconjuntos(range(1, mitad + 1))
+        segunda = self._enumerar_subconjuntos(range(mitad + 1, self.n + 1))
+
+        # Frontera no dominada de la segunda mitad, ordenada por peso. El
+        # orden es estable, así que entre pesos iguales se reemplaza el último
+        # punto si el nuevo tiene más beneficio.
+        pesos, beneficios, mascaras = segunda
+        frontera_peso = array('q')
+        frontera_beneficio = array('q')
+        frontera_mascara = array('q')
+        for t in sorted(range(len(pesos)), key=pesos.__getitem__):
+            beneficio = beneficios[t]
+            if not frontera_beneficio or beneficio > frontera_beneficio[-1]:
+                if frontera_peso and frontera_peso[-1] == pesos[t]:
+                    frontera_beneficio[-1] = beneficio
+                    frontera_mascara[-1] = mascaras[t]
                 else:
-                    cota += (self.beneficio[obj] / self.peso[obj]) * restante
-                    break
-            return cota
-        
-        def backtrack(ind, p, b, sel):
+                    frontera_peso.append(pesos[t])
+                    frontera_beneficio.append(beneficio)
+                    frontera_mascara.append(mascaras[t])
+        enumerados = len(primera[0]) + len(pesos)
+        del segunda, pesos, beneficios, mascaras
+
+        mejor_beneficio = -1
+        mejor = (0, 0)
+        for peso, beneficio, mascara in zip(*primera):
+            k = bisect_right(frontera_peso, self.capacidad - peso) - 1
+            if beneficio + frontera_beneficio[k] > mejor_beneficio:
+                mejor_beneficio = beneficio + frontera_beneficio[k]
+                mejor = (mascara, frontera_mascara[k])
+
+        seleccionados = [i for i in range(1, mitad + 1)
+                         if mejor[0] >> (i - 1) & 1]
+        seleccionados += [i for i in range(mitad + 1, self.n + 1)
+                          if mejor[1] >> (i - mitad - 1) & 1]
+
+        tiempo = reloj.intervalo_tiempo()
+
+        return SolucionMochila(
+            seleccionados=seleccionados,
+            beneficio=mejor_beneficio,
+            peso_total=sum(self.peso[i] for i in seleccionados),
+            soluciones_factibles=enumerados,
+            tiempo=reloj.formato_tiempo(tiempo)
+        )
+
+    def busqueda_nucleo(self) -> SolucionMochila:
+        """
+        Resolución de instancias grandes mediante reducción y núcleo.
+
+        1. Ordena por razón beneficio/peso y ubica el ítem crítico s; la
+           solución de ruptura toma exactamente los ítems anteriores a s.
+        2. Para cada ítem j se calcula en O(log n), con sumas prefijas, la
+           cota de Dantzig de las soluciones que contradicen su valor en la
+           relajación; si no supera la mejor solución conocida, x_j queda
+           fija (1 antes de s, 0 después).
+        3. El núcleo crece alrededor de s, un ítem libre por lado a la vez,
+           con programación dinámica sobre estados (peso, beneficio) no
+           dominados: quitar un ítem anterior a s o agregar uno posterior.
+           Un estado se descarta si su cota (la razón del siguiente ítem
+           del lado que le falta ajustar) no supera la mejor solución, y
+           cada mejora repite la reducción sobre los ítems pendientes. Al
+           no quedar estados la mejor solución es óptima.
+
+        soluciones_factibles cuenta los estados factibles generados.
+        """
+        reloj = MedidorTiempo()
+        reloj.cargar_tiempo()
+
+        orden = [i for i in range(1, self.n + 1) if self.peso[i] <= self.capacidad]
+        orden.sort(key=lambda i: self.beneficio[i] / self.peso[i], reverse=True)
+
+        # Ítem crítico: el primero que ya no cabe completo
+        critico = 0
+        peso_lp = 0
+        beneficio_lp = 0
+        while critico < len(orden) and \
+                peso_lp + self.peso[orden[critico]] <= self.capacidad:
+            peso_lp += self.peso[orden[critico]]
+            beneficio_lp += self.beneficio[orden[critico]]
+            critico += 1
+
+        # Solución inicial: solución de ruptura + greedy con lo que sobra
+        mejor_sol = orden[:critico]
+        mejor_beneficio = beneficio_lp
+        restante = self.capacidad - peso_lp
+        for i in orden[critico:]:
+            if self.peso[i] <= restante:
+                mejor_sol.append(i)
+                mejor_beneficio += self.beneficio[i]
+                restante -= self.peso[i]
+
+        # Sumas prefijas en el orden de la razón
+        prefijo_peso = [0]
+        prefijo_beneficio = [0]
+        for i in orden:
+            prefijo_peso.append(prefijo_peso[-1] + self.peso[i])
+            prefijo_beneficio.append(prefijo_beneficio[-1] + self.beneficio[i])
+
+        def cota_invertida(k: int) -> Tuple[int, int]:
             """
-            Backtracking con poda por cota superior.
+            Cota de Dantzig, como fracción (numerador, denominador), de las
+            soluciones en que el ítem de la posición k toma el valor
+            contrario al de la relajación (0 si k < s, 1 si k >= s).
             """
-            nonlocal mejor_beneficio, mejor_sol, soluciones_factibles
-
-            if ind == self.n:
-                soluciones_factibles += 1
-                if b > mejor_beneficio:
-                    mejor_beneficio = b
-                    mejor_sol = sel[:]
-                return
-            
-            if cota_superior(ind, p, b) <= mejor_beneficio:
-                return
-            
-            obj = objetos[ind]
-
-            if p + self.peso[obj] <= self.capacidad:
-                sel.append(obj)
-                backtrack(ind + 1,
-                        p + self.peso[obj],
-                        b + self.beneficio[obj],
-                        sel)
-                sel.pop()
-
-            backtrack(ind + 1, p, b, sel)
+            peso_k = self.peso[orden[k]]
+            if k < critico:
+                capacidad = self.capacidad
+                parcial = -self.beneficio[orden[k]]
+                # Sin el ítem k cabe el prefijo 0..t-1 salvo k
+                t = bisect_right(prefijo_peso, capacidad + peso_k) - 1
+                restante = capacidad - (prefijo_peso[t] - peso_k)
+                fraccion = t
+            else:
+                capacidad = self.capacidad - peso_k
+                parcial = self.beneficio[orden[k]]
+                t = bisect_right(prefijo_peso, capacidad) - 1
+                restante = capacidad - prefijo_peso[t]
+                fraccion = t if t < k else k + 1
+            parcial += prefijo_beneficio[t]
 
-        
-        backtrack(0, 0, 0, [])
-        
+            if fraccion >= len(orden):
+                return parcial, 1
+            i = orden[fraccion]
+            return parcial * self.peso[i] + self.beneficio[i] * restante, self.peso[i]
+
+        def libre(k: int) -> bool:
+            """Indica si el ítem de la posición k todavía puede cambiar."""
+            numerador, denominador = cota_invertida(k)
+            return numerador >= (mejor_beneficio + 1) * denominador
+
+        # Reducción: solo los ítems libres pueden cambiar de valor
+        antes = [k for k in range(critico - 1, -1, -1) if libre(k)]
+        despues = [k for k in range(critico, len(orden)) if libre(k)]
+        reducido = mejor_beneficio
+
+        # Estados no dominados: peso, beneficio y máscara de ítems cambiados
+        pesos = [peso_lp]
+        beneficios = [beneficio_lp]
+        mascaras = [0]
+        cambiados = []          # bit t de una máscara = ítem cambiados[t]
+        mejor_mascara = None
+        soluciones_factibles = 1
+        a = b = 0
+
+        while pesos and (a < len(antes) or b < len(despues)):
+            # Expandir el núcleo alternando los lados de s
+            quitar = b >= len(despues) or (a < len(antes) and a <= b)
+            if quitar:
+                i = orden[antes[a]]
+                p = -self.peso[i]
+                v = -self.beneficio[i]
+                a += 1
+            else:
+                i = orden[despues[b]]
+                p = self.peso[i]
+                v = self.beneficio[i]
+                b += 1
+            bit = 1 << len(cambiados)
+            cambiados.append(i)
+
+            candidatos = sorted(
+                list(zip(pesos, beneficios, mascaras)) +
+                [(w + p, x + v, m | bit) for w, x, m in zip(pesos, beneficios, mascaras)],
+                key=lambda e: (e[0], -e[1]))
+
+            # Razones de los siguientes ítems de cada lado para las cotas
+            sig_quitar = orden[antes[a]] if a < len(antes) else 0
+            sig_agregar = orden[despues[b]] if b < len(despues) else 0
+
+            pesos = []
+            beneficios = []
+            mascaras = []
+            maximo = None
+            for w, x, m in candidatos:
+                # Dominancia: menos peso y al menos el mismo beneficio
+                if maximo is not None and x <= maximo:
+                    continue
+                maximo = x
+
+                if w <= self.capacidad:
+                    soluciones_factibles += 1
+                    if x > mejor_beneficio:
+                        mejor_beneficio = x
+                        mejor_mascara = m
+                    if not sig_agregar:
+                        continue
+                    pw = self.peso[sig_agregar]
+                    cota = x * pw + (self.capacidad - w) * self.beneficio[sig_agregar]
+                else:
+                    if not sig_quitar:
+                        continue
+                    pw = self.peso[sig_quitar]
+                    cota = x * pw - (w - self.capacidad) * self.beneficio[sig_quitar]
+                if cota < (mejor_beneficio + 1) * pw:
+                    continue
+
+                pesos.append(w)
+                beneficios.append(x)
+                mascaras.append(m)
+
+            # Una mejor solución fija más ítems de los que faltan por expandir
+            if mejor_beneficio > reducido:
+                antes[a:] = [k for k in antes[a:] if libre(k)]
+                despues[b:] = [k for k in despues[b:] if libre(k)]
+                reducido = mejor_beneficio
+
+        if mejor_mascara is not None:
+            invertidos = {cambiados[t] for t in range(len(cambiados))
+                          if mejor_mascara >> t & 1}
+            mejor_sol = [i for i in orden[:critico] if i not in invertidos]
+            mejor_sol += [i for i in orden[critico:] if i in invertidos]
+
+        mejor_sol.sort()
         tiempo = reloj.intervalo_tiempo()
-        
+
         return SolucionMochila(
             seleccionados=mejor_sol,
             beneficio=mejor_beneficio,
@@ -195,3 +545,418 @@ class ProblemaMochila:
             soluciones_factibles=soluciones_factibles,
             tiempo=reloj.formato_tiempo(tiempo)
         )
+
+    def busqueda_fptas(self, epsilon: float = 0.1) -> SolucionMochila:
+        """
+        Esquema de aproximación (FPTAS) por escalamiento de beneficios.
+
+        Con LB = max(greedy, mejor ítem) >= óptimo / 2 y K = epsilon·LB/n,
+        cada beneficio se reemplaza por floor(b/K) y se resuelve una
+        programación dinámica exacta sobre el beneficio escalado que guarda
+        el menor peso para alcanzar cada valor. Hay a lo sumo 2n/epsilon
+        valores, así que el tiempo es O(n²/epsilon) sin importar la
+        capacidad, y el resultado vale al menos (1 - epsilon)·óptimo.
+
+        Args:
+            epsilon: Error relativo permitido, 0 < epsilon < 1
+
+        Returns:
+            SolucionMochila cuyo cota_superior acota el beneficio óptimo
+            (mínimo entre la cota de Dantzig y beneficio + n·K).
+        """
+        if not 0 < epsilon < 1:
+            raise ValueError("epsilon debe estar entre 0 y 1")
+
+        reloj = MedidorTiempo()
+        reloj.cargar_tiempo()
+
+        items = [i for i in range(1, self.n + 1) if self.peso[i] <= self.capacidad]
+        items.sort(key=lambda i: self.beneficio[i] / self.peso[i], reverse=True)
+
+        # Cota de Dantzig y greedy en el orden de la razón
+        peso_lp = 0
+        cota = 0
+        greedy = 0
+        restante = self.capacidad
+        fraccion = True
+        for i in items:
+            p = self.peso[i]
+            if fraccion:
+                if peso_lp + p <= self.capacidad:
+                    peso_lp += p
+                    cota += self.beneficio[i]
+                else:
+                    cota += self.beneficio[i] * (self.capacidad - peso_lp) // p
+                    fraccion = False
+            if p <= restante:
+                greedy += self.beneficio[i]
+                restante -= p
+
+        inferior = max([greedy] + [self.beneficio[i] for i in items])
+        escala = max(epsilon * inferior / len(items), 1.0) if items else 1.0
+
+        # menor_peso[q]: menor peso con beneficio escalado q
+        infinito = self.capacidad + 1
+        menor_peso = [0] + [infinito] * int(cota / escala)
+        escalados = [0] * (self.n + 1)
+        decisiones = [0] * (self.n + 1)
+
+        alcanzable = 0      # Mayor beneficio escalado con los ítems vistos
+        for i in items:
+            q = int(self.beneficio[i] / escala)
+            p = self.peso[i]
+            escalados[i] = q
+            if q == 0 or q >= len(menor_peso):
+                continue
+            alcanzable = min(alcanzable + q, len(menor_peso) - 1)
+
+            sin_item = menor_peso[q:alcanzable + 1]
+            tomar = [x + p < y for x, y in zip(menor_peso, sin_item)]
+            menor_peso[q:alcanzable + 1] = [x + p if t else y
+                                            for x, y, t in zip(menor_peso, sin_item, tomar)]
+
+            bits = bytes(tomar).translate(_A_BINARIO)[::-1]
+            decisiones[i] = int(bits, 2) << q if bits else 0
+
+        q = max(v for v in range(len(menor_peso)) if menor_peso[v] <= self.capacidad)
+        seleccionados = []
+        for i in reversed(items):
+            if (decisiones[i] >> q) & 1:
+                seleccionados.append(i)
+                q -= escalados[i]
+        seleccionados.sort()
+
+        beneficio = sum(self.beneficio[i] for i in seleccionados)
+        if escala > 1:
+            cota = min(cota, beneficio + int(len(items) * escala) + 1)
+        else:
+            cota = beneficio     # Sin escalamiento la solución es exacta
+
+        tiempo = reloj.intervalo_tiempo()
+
+        return SolucionMochila(
+            seleccionados=seleccionados,
+            beneficio=beneficio,
+            peso_total=sum(self.peso[i] for i in seleccionados),
+            tiempo=reloj.formato_tiempo(tiempo),
+            cota_superior=cota
+        )
+
+    def _enumerar_subconjuntos(self, items) -> Tuple[array, array, array]:
+        """
+        Enumera los subconjuntos de items que caben en la mochila.
+
+        Returns:
+            Arreglos 'q' paralelos de peso, beneficio y máscara (bit k =
+            k-ésimo ítem).
+        """
+        pesos = array('q', [0])
+        beneficios = array('q', [0])
+        mascaras = array('q', [0])
+
+        for k, i in enumerate(items):
+            p = self.peso[i]
+            b = self.beneficio[i]
+            bit = 1 << k
+            limite = self.capacidad - p
+            # Cada lista se arma completa antes de extender el arreglo
+            caben = [w <= limite for w in pesos]
+            pesos.extend([w + p for w in compress(pesos, caben)])
+            beneficios.extend([v + b for v in compress(beneficios, caben)])
+            mascaras.extend([m | bit for m in compress(mascaras, caben)])
+
+        return pesos, beneficios, mascaras
+
+    def _tabla_dp(self, capacidad: int) -> Tuple[List[int], List[int]]:
+        """
+        Calcula la tabla de la programación dinámica hasta la capacidad dada.
+
+        Returns:
+            valores[c]: mejor beneficio con capacidad c usando todos los ítems.
+            decisiones[i]: bits c en 1 si el ítem i se toma con capacidad c.
+        """
+        valores = [0] * (capacidad + 1)
+        decisiones = [0] * (self.n + 1)
+
+        for i in range(1, self.n + 1):
+            p = self.peso[i]
+            b = self.beneficio[i]
+            if p > capacidad:
+                continue
+
+            # Para c >= p: tomar el ítem si valores[c - p] + b > valores[c]
+            sin_item = valores[p:]
+            tomar = [x + b > y for x, y in zip(valores, sin_item)]
+            valores[p:] = [x + b if t else y
+                           for x, y, t in zip(valores, sin_item, tomar)]
+
+            bits = bytes(tomar).translate(_A_BINARIO)[::-1]
+            decisiones[i] = int(bits, 2) << p if bits else 0
+
+        return valores, decisiones
+
+    def _reconstruir_dp(self, decisiones: List[int], capacidad: int) -> List[int]:
+        """
+        Recorre los ítems de atrás hacia adelante siguiendo los bits de
+        decisión para recuperar los seleccionados con la capacidad dada.
+        """
+        seleccionados = []
+        c = capacidad
+        for i in range(self.n, 0, -1):
+            if (decisiones[i] >> c) & 1:
+                seleccionados.append(i)
+                c -= self.peso[i]
+
+        seleccionados.reverse()
+        return seleccionados
+
+    def _suma_subconjuntos(self, capacidad: int) -> List[int]:
+        """
+        Suma de subconjuntos con un entero como conjunto de bits: el bit c
+        indica que alguna combinación de ítems pesa exactamente c, y agregar
+        un ítem es alcanzables |= alcanzables << peso. Cada desplazamiento
+        trabaja por palabras de máquina, mucho más rápido que recorrer la
+        tabla de valores.
+
+        Returns:
+            Ítems cuya suma es la mayor alcanzable sin pasar la capacidad.
+        """
+        mascara = (1 << (capacidad + 1)) - 1
+        alcanzables = 1
+        prefijos = [alcanzables]        # prefijos[i]: sumas con los ítems 1..i
+
+        for i in range(1, self.n + 1):
+            alcanzables |= (alcanzables << self.peso[i]) & mascara
+            prefijos.append(alcanzables)
+
+        # Si la suma c ya era alcanzable sin el ítem i, no hace falta tomarlo
+        seleccionados = []
+        c = alcanzables.bit_length() - 1
+        for i in range(self.n, 0, -1):
+            if not (prefijos[i - 1] >> c) & 1:
+                seleccionados.append(i)
+                c -= self.peso[i]
+
+        seleccionados.reverse()
+        return seleccionados
+
+
+class _ExhaustivaMochila(MotorBacktracking):
+    """
+    Backtracking sin podas. El nivel i decide el ítem i: primero la rama
+    sin él y después, si cabe, la rama con él.
+
+    opcion[i]: 0 sin empezar, 1 rama sin el ítem hecha, 2 ítem tomado,
+    3 agotado sin tomarlo. El nodo del último ítem y sus dos hojas se
+    evalúan al generarlos desde el nivel n - 1, sin apilarlos.
+    """
+
+    def __init__(self, peso, beneficio, capacidad, n):
+        super().__init__(1, n)
+        self.peso = peso
+        self.beneficio = beneficio
+        self.capacidad = capacidad
+        self.n = n
+        self.peso_actual = 0
+        self.beneficio_actual = 0
+        self.mejor_beneficio = 0
+        self.mejor_opcion = None        # Copia de opcion en la mejor hoja
+        self.soluciones_factibles = 0
+        if n == 0:
+            # La raíz ya es la única hoja
+            self.soluciones_factibles = 1
+            self.nivel = 0
+
+    def seleccionados(self) -> List[int]:
+        """Ítems de la mejor solución encontrada."""
+        if self.mejor_opcion is None:
+            return []
+        return [i for i in range(1, self.n + 1) if self.mejor_opcion[i] == 2]
+
+    def _recorrer(self, limite: int) -> int:
+        peso = self.peso
+        beneficio = self.beneficio
+        capacidad = self.capacidad
+        n = self.n
+        peso_n = peso[n]
+        beneficio_n = beneficio[n]
+        opcion = self.opcion
+        nivel = self.nivel
+        p = self.peso_actual
+        b = self.beneficio_actual
+        mejor = self.mejor_beneficio
+        factibles = self.soluciones_factibles
+        visitados = 0
+
+        while visitados < limite:
+            o = opcion[nivel]
+            if o == 0:
+                # Rama sin el ítem
+                opcion[nivel] = 1
+                p_hijo = p
+                b_hijo = b
+            elif o == 1:
+                # Rama con el ítem, si cabe
+                p_hijo = p + peso[nivel]
+                if p_hijo > capacidad:
+                    opcion[nivel] = 3
+                    continue
+                opcion[nivel] = 2
+                b_hijo = b + beneficio[nivel]
+            else:
+                # Nivel agotado: volver al anterior y deshacer su ítem
+                nivel -= 1
+                if nivel < 1:
+                    break
+                if opcion[nivel] == 2:
+                    p -= peso[nivel]
+                    b -= beneficio[nivel]
+                continue
+
+            visitados += 1
+            if nivel < n - 1:
+                p = p_hijo
+                b = b_hijo
+                nivel += 1
+                opcion[nivel] = 0
+                continue
+
+            if nivel == n:
+                # n == 1: el hijo de la raíz ya es una hoja
+                factibles += 1
+                if b_hijo > mejor:
+                    mejor = b_hijo
+                    self.mejor_opcion = opcion[:]
+                continue
+
+            # El hijo decide el ítem n: evaluar sus hojas sin apilarlo
+            visitados += 1
+            factibles += 1
+            if b_hijo > mejor:
+                mejor = b_hijo
+                self.mejor_opcion = opcion[:]
+                self.mejor_opcion[n] = 1
+            if p_hijo + peso_n <= capacidad:
+                visitados += 1
+                factibles += 1
+                if b_hijo + beneficio_n > mejor:
+                    mejor = b_hijo + beneficio_n
+                    self.mejor_opcion = opcion[:]
+                    self.mejor_opcion[n] = 2
+
+        self.nivel = nivel
+        self.peso_actual = p
+        self.beneficio_actual = b
+        self.mejor_beneficio = mejor
+        self.soluciones_factibles = factibles
+        return visitados
+
+
+class _RamificacionMochila(MotorBacktracking):
+    """
+    Backtracking con poda por la cota de la relajación fraccionaria. Los
+    objetos se recorren por razón beneficio/peso decreciente; el nivel k
+    decide objetos[k]: primero con él y luego sin él.
+
+    self.nivel siempre apunta a un nodo recién generado. opcion[k] vale 1
+    si el nivel k tomó su objeto (falta la rama sin él) y 2 si ya generó
+    la rama sin el objeto.
+    """
+
+    def __init__(self, peso, beneficio, capacidad, n):
+        super().__init__(0, n)
+        self.peso = peso
+        self.beneficio = beneficio
+        self.capacidad = capacidad
+        self.n = n
+
+        self.objetos = list(range(1, n + 1))
+        self.objetos.sort(key=lambda i: beneficio[i] / peso[i], reverse=True)
+        
+        # Sumas prefijas de peso y beneficio en el orden de la razón
+        self.prefijo_peso = [0] * (n + 1)
+        self.prefijo_beneficio = [0] * (n + 1)
+        for k, obj in enumerate(self.objetos):
+            self.prefijo_peso[k + 1] = self.prefijo_peso[k] + peso[obj]
+            self.prefijo_beneficio[k + 1] = self.prefijo_beneficio[k] + beneficio[obj]
+
+        self.peso_actual = 0
+        self.beneficio_actual = 0
+        self.mejor_beneficio = 0
+        self.mejor_opcion = None        # Copia de opcion en la mejor hoja
+        self.soluciones_factibles = 0
+
+    def seleccionados(self) -> List[int]:
+        """Objetos de la mejor solución encontrada, en orden de razón."""
+        if self.mejor_opcion is None:
+            return []
+        return [self.objetos[k] for k in range(self.n) if self.mejor_opcion[k] == 1]
+
+    def _recorrer(self, limite: int) -> int:
+        peso = self.peso
+        beneficio = self.beneficio
+        capacidad = self.capacidad
+        n = self.n
+        objetos = self.objetos
+        prefijo_peso = self.prefijo_peso
+        prefijo_beneficio = self.prefijo_beneficio
+        opcion = self.opcion
+        nivel = self.nivel
+        p = self.peso_actual
+        b = self.beneficio_actual
+        mejor = self.mejor_beneficio
+        factibles = self.soluciones_factibles
+        visitados = 0
+
+        while visitados < limite:
+            if nivel == n:
+                factibles += 1
+                if b > mejor:
+                    mejor = b
+                    self.mejor_opcion = opcion[:]
+            else:
+                # Cota superior (relajación fraccionaria) en O(log n): los
+                # objetos nivel..critico-1 caben completos; el crítico, en
+                # fracción
+                restante = capacidad - p
+                critico = bisect_right(prefijo_peso, prefijo_peso[nivel] + restante,
+                                       nivel) - 1
+                cota = b + prefijo_beneficio[critico] - prefijo_beneficio[nivel]
+                if critico < n:
+                    obj = objetos[critico]
+                    restante -= prefijo_peso[critico] - prefijo_peso[nivel]
+                    cota += (beneficio[obj] / peso[obj]) * restante
+
+                if cota > mejor:
+                    obj = objetos[nivel]
+                    if p + peso[obj] <= capacidad:
+                        # Rama con el objeto
+                        p += peso[obj]
+                        b += beneficio[obj]
+                        opcion[nivel] = 1
+                    else:
+                        opcion[nivel] = 2
+                    nivel += 1
+                    visitados += 1
+                    continue
+
+            # Hoja o nodo podado: retroceder hasta un nivel que tomó su
+            # objeto, deshacerlo y generar la rama sin él
+            nivel -= 1
+            while nivel >= 0 and opcion[nivel] == 2:
+                nivel -= 1
+            if nivel < 0:
+                break
+            obj = objetos[nivel]
+            p -= peso[obj]
+            b -= beneficio[obj]
+            opcion[nivel] = 2
+            nivel += 1
+            visitados += 1
+
+        self.nivel = nivel
+        self.peso_actual = p
+        self.beneficio_actual = b
+        self.mejor_beneficio = mejor
+        self.soluciones_factibles = factibles
+        return visitados
@@ -23,7 +23,7 @@ from rich.padding import Padding
 from tiempo import MedidorTiempo
 from asign1a1 import ProblemaAsigna1a1, SolucionAsigna1a1
 from mochila import ProblemaMochila, SolucionMochila
-from vendedor import ProblemaVendedor, SolucionVendedor
+from vendedor import MatrizSimetrica, ProblemaVendedor, SolucionVendedor
 from recursos import DistribucionRecursos, SolucionDistribucion
 
 
@@ -481,12 +481,8 @@ def problema_vendedor():
     else:
         aleatoria = Confirm.ask("¿Desea generar las distancias entre ciudades aleatoriamente?")
     
-    # Crear matriz de adyacencia
-    matriz = [[0] * (tamano + 1) for _ in range(tamano + 1)]
-    
-    # Diagonal en cero
-    for i in range(1, tamano + 1):
-        matriz[i][i] = 0
+    # Crear matriz de adyacencia (solo el triángulo superior; diagonal en cero)
+    matriz = MatrizSimetrica(tamano)
     
     if aleatoria:
         console.print("\n[cyan]Generando matriz aleatoria...[/cyan]\n")
@@ -504,26 +500,23 @@ def problema_vendedor():
                     if i == j:
                         fila.append("0")
                     elif i < j:
-                        matriz[i][j] = random.randint(1, 299)
-                        matriz[j][i] = matriz[i][j]
-                        fila.append(str(matriz[i][j]))
+                        matriz.fijar(i, j, random.randint(1, 299))
+                        fila.append(str(matriz.distancia(i, j)))
                     else:
-                        fila.append(str(matriz[i][j]))
+                        fila.append(str(matriz.distancia(i, j)))
                 tabla.add_row(*fila)
             
             console.print(tabla)
         else:
             for i in range(1, tamano + 1):
                 for j in range(i + 1, tamano + 1):
-                    matriz[i][j] = random.randint(1, 299)
-                    matriz[j][i] = matriz[i][j]
+                    matriz.fijar(i, j, random.randint(1, 299))
     else:
         console.print("\n[cyan]Digite la distancia de la ciudad i a la ciudad j:[/cyan]\n")
         for i in range(1, tamano + 1):
             for j in range(i + 1, tamano + 1):
                 valor = IntPrompt.ask(f"Distancia[{chr(i + 96)}][{chr(j + 96)}]")
-                matriz[i][j] = valor
-                matriz[j][i] = valor
+                matriz.fijar(i, j, valor)
     
     Prompt.ask("\nPulse ENTER para continuar")
     
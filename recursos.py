@@ -3,6 +3,8 @@ import math
 from dataclasses import dataclass
 from typing import List
 
+from busqueda import MotorBacktracking
+
 
 @dataclass
 class SolucionDistribucion:
@@ -106,46 +108,19 @@ class DistribucionRecursos:
         Returns:
             La mejor solución encontrada en todo el espacio de búsqueda.
         """
-        mejor_valor = -math.inf
-        mejor_distribucion = None
-        intentos = 0
         tiempo = time.time()
 
-        def compositions(T, M):
-            """
-            Genera todas las composiciones de T unidades en M columnas.
-            Ejemplo: compositions(3,2) → (0,3),(1,2),(2,1),(3,0)
-            """
-            if M == 1:
-                yield (T,)
-            else:
-                for i in range(T + 1):
-                    for rest in compositions(T - i, M - 1):
-                        yield (i,) + rest
-
         # Explorar cada composición posible
-        for distribucion in compositions(self.R, self.M):
-            intentos += 1
-
-            # Establece el límite máximo por columna
-            if any(a > self.maximo for a in distribucion):
-                continue
-
-            # Calcular ganancia
-            valor = sum(self.tabla[distribucion[j]][j] for j in range(self.M))
-
-            # Guardar mejor
-            if valor > mejor_valor:
-                mejor_valor = valor
-                mejor_distribucion = distribucion
+        busqueda = _ComposicionesRecursos(self.tabla, self.R, self.M, self.maximo)
+        busqueda.ejecutar()
 
         t = time.time() - tiempo
 
         return SolucionDistribucion(
-            distribucion=[0] + list(mejor_distribucion),
-            ganancia=mejor_valor,
-            soluciones_factibles=intentos,
-            intentos=intentos,
+            distribucion=[0] + list(busqueda.mejor_distribucion),
+            ganancia=busqueda.mejor_valor,
+            soluciones_factibles=busqueda.intentos,
+            intentos=busqueda.intentos,
             tiempo=t
         )
 
@@ -164,61 +139,184 @@ class DistribucionRecursos:
         Returns:
             Mejor solución obtenida con podas.
         """
-        mejor_valor = -math.inf
-        mejor_distribucion = None
-        intentos = 0
         tiempo = time.time()
 
-        # Cálculo previo: mejor ganancia disponible por columna
-        col_maximo = [0] * (self.M + 1)
-        for j in range(1, self.M + 1):
-            col_maximo[j] = max(self.tabla[u][j] for u in range(self.maximo + 1))
-
-        def dfs(j, restante, actual_distribucion, suma_actual):
-            """
-            Función recursiva DFS con poda.
-
-            Args:
-                j: Índice de columna actual.
-                restante: Unidades por asignar.
-                actual_distribucion: Lista con la asignación parcial.
-                suma_actual: Ganancia acumulada.
-            """
-            nonlocal mejor_valor, mejor_distribucion, intentos
-            intentos += 1
-
-            # Cota superior optimista: suma_actual + sumatorio de máximos restantes
-            optimistic = suma_actual + sum(col_maximo[k] for k in range(j, self.M))
-
-            # Poda si ya no puede superar la mejor solución
-            if optimistic <= mejor_valor:
-                return
-
-            # Si llegamos al final, validar solución
-            if j > self.M:
-                if restante == 0 and suma_actual > mejor_valor:
-                    mejor_valor = suma_actual
-                    mejor_distribucion = actual_distribucion.copy()
-                return
-
-            # Probar todas las asignaciones posibles para esta columna
-            for u in range(min(self.maximo, restante), -1, -1):
-                actual_distribucion.append(u)
-                dfs(
-                    j + 1,
-                    restante - u,
-                    actual_distribucion,
-                    suma_actual + self.tabla[u][j]
-                )
-                actual_distribucion.pop()
-
-        dfs(1, self.R, [], 0)
+        busqueda = _RamificacionRecursos(self.tabla, self.R, self.M, self.maximo)
+        busqueda.ejecutar()
         t = time.time() - tiempo
 
         return SolucionDistribucion(
-            distribucion=[0] + mejor_distribucion,
-            ganancia=mejor_valor,
-            soluciones_factibles=intentos,
-            intentos=intentos,
+            distribucion=[0] + busqueda.mejor_distribucion,
+            ganancia=busqueda.mejor_valor,
+            soluciones_factibles=busqueda.intentos,
+            intentos=busqueda.intentos,
             tiempo=t
         )
+
+
+class _ComposicionesRecursos(MotorBacktracking):
+    """
+    Genera todas las composiciones de R unidades en las columnas 0..M-1; la
+    última columna recibe lo que sobra. Ejemplo con 3 unidades y 2
+    columnas: (0,3),(1,2),(2,1),(3,0).
+
+    opcion[k] es la próxima cantidad a probar en la columna k. Las hojas
+    (columna M-1) se evalúan al generarlas desde la columna M-2.
+    """
+
+    def __init__(self, tabla, R, M, maximo):
+        super().__init__(0, M - 1)
+        self.tabla = tabla
+        self.M = M
+        self.maximo = maximo
+        self.distribucion = [0] * M
+        self.restante = R
+        self.mejor_valor = -math.inf
+        self.mejor_distribucion = None
+        self.intentos = 0
+        if M == 1:
+            # La raíz ya es la única hoja
+            self.distribucion[0] = R
+            self._evaluar()
+            self.nivel = -1
+
+    def _evaluar(self):
+        """Evalúa la composición completa que hay en distribucion."""
+        distribucion = self.distribucion
+        self.intentos += 1
+
+        # Establece el límite máximo por columna
+        if any(a > self.maximo for a in distribucion):
+            return
+
+        # Calcular ganancia
+        valor = sum(self.tabla[distribucion[j]][j] for j in range(self.M))
+
+        # Guardar mejor
+        if valor > self.mejor_valor:
+            self.mejor_valor = valor
+            self.mejor_distribucion = tuple(distribucion)
+
+    def _recorrer(self, limite):
+        distribucion = self.distribucion
+        opcion = self.opcion
+        ultima = self.M - 1
+        nivel = self.nivel
+        restante = self.restante
+        visitados = 0
+
+        while visitados < limite:
+            i = opcion[nivel]
+            if i > restante:
+                # Columna agotada: volver a la anterior y devolver sus unidades
+                nivel -= 1
+                if nivel < 0:
+                    break
+                restante += distribucion[nivel]
+                continue
+
+            opcion[nivel] = i + 1
+            distribucion[nivel] = i
+            visitados += 1
+            if nivel + 1 == ultima:
+                distribucion[ultima] = restante - i
+                self._evaluar()
+                continue
+
+            restante -= i
+            nivel += 1
+            opcion[nivel] = 0
+
+        self.nivel = nivel
+        self.restante = restante
+        return visitados
+
+
+class _RamificacionRecursos(MotorBacktracking):
+    """
+    Recorre las distribuciones columna por columna (1..M) probando de la
+    mayor cantidad posible a 0, y poda las ramas cuya cota optimista no
+    supera la mejor ganancia encontrada.
+
+    opcion[j] es 1 + la próxima cantidad a probar en la columna j (0: sin
+    más ramas, -1: nodo recién apilado, falta acotarlo).
+    """
+
+    def __init__(self, tabla, R, M, maximo):
+        super().__init__(1, M + 1)
+        self.tabla = tabla
+        self.M = M
+        self.maximo = maximo
+        self.distribucion = [0] * (M + 2)   # Asignación parcial
+        self.restante = R                   # Unidades por asignar
+        self.suma_actual = 0                # Ganancia acumulada
+        self.mejor_valor = -math.inf
+        self.mejor_distribucion = None
+        self.intentos = 0
+
+        # Cálculo previo: mejor ganancia disponible por columna
+        col_maximo = [0] * (M + 1)
+        for j in range(1, M + 1):
+            col_maximo[j] = max(tabla[u][j] for u in range(maximo + 1))
+
+        # resto_maximo[j]: suma de col_maximo[j..M-1]
+        self.resto_maximo = [0] * (M + 2)
+        for j in range(M - 1, 0, -1):
+            self.resto_maximo[j] = self.resto_maximo[j + 1] + col_maximo[j]
+
+        self.opcion[1] = -1
+
+    def _recorrer(self, limite):
+        tabla = self.tabla
+        M = self.M
+        resto_maximo = self.resto_maximo
+        distribucion = self.distribucion
+        opcion = self.opcion
+        nivel = self.nivel
+        restante = self.restante
+        suma_actual = self.suma_actual
+        mejor_valor = self.mejor_valor
+        visitados = 0
+
+        while visitados < limite:
+            siguiente = opcion[nivel]
+            if siguiente < 0:
+                self.intentos += 1
+                siguiente = 0
+
+                # Cota superior optimista: suma_actual + sumatorio de máximos
+                # restantes; poda si ya no puede superar la mejor solución
+                if suma_actual + resto_maximo[nivel] <= mejor_valor:
+                    pass
+                elif nivel > M:
+                    # Si llegamos al final, validar solución
+                    if restante == 0 and suma_actual > mejor_valor:
+                        mejor_valor = suma_actual
+                        self.mejor_distribucion = distribucion[1:M + 1]
+                else:
+                    siguiente = min(self.maximo, restante) + 1
+
+            if siguiente > 0:
+                u = siguiente - 1
+                opcion[nivel] = u
+                distribucion[nivel] = u
+                restante -= u
+                suma_actual += tabla[u][nivel]
+                nivel += 1
+                opcion[nivel] = -1
+                visitados += 1
+                continue
+
+            # Columna agotada: volver a la anterior y deshacer su asignación
+            nivel -= 1
+            if nivel < 1:
+                break
+            u = distribucion[nivel]
+            restante += u
+            suma_actual -= tabla[u][nivel]
+
+        self.nivel = nivel
+        self.restante = restante
+        self.suma_actual = suma_actual
+        self.mejor_valor = mejor_valor
+        return visitados
@@ -1,5 +1,16 @@
+import heapq
+import math
+import multiprocessing
+from array import array
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from typing import List
+from functools import partial
+from multiprocessing import shared_memory
+from numbers import Integral
+from operator import add
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from busqueda import MotorBacktracking
 
 
 @dataclass
@@ -10,26 +21,271 @@ class SolucionVendedor:
     camino: List[str]
     costo: int
     soluciones_factibles: int = 0
+    nodos_expandidos: int = 0
+    costo_inicial: int = 0      # Búsqueda local: costo de la ruta de partida
+    movimientos: int = 0        # Búsqueda local: mejoras 2-opt y Or-opt aplicadas
+    memo_aciertos: int = 0      # RA con memo: estados que ya estaban en la tabla
+    memo_podas: int = 0         # RA con memo: ramas podadas por dominancia
 
 
 def letra(ciudad: int) -> str:
     """
-    Convierte un número 1 -> 'a', 2 -> 'b', etc.
+    Convierte un número 1 -> 'a', 2 -> 'b', ..., 26 -> 'z', 27 -> 'aa', etc.
+    (base 26 biyectiva, sirve para cualquier n).
+    """
+    etiqueta = ""
+    while ciudad > 0:
+        ciudad, resto = divmod(ciudad - 1, 26)
+        etiqueta = chr(resto + 97) + etiqueta
+    return etiqueta
+
+
+class MatrizCoordenadas:
+    """
+    Distancias entre ciudades calculadas bajo demanda a partir de sus
+    coordenadas (x, y), sin guardar la matriz de n² entradas.
+
+    distancia(i, j) calcula un par en O(1); matriz[i] devuelve la fila i
+    completa y guarda las últimas filas pedidas en un caché pequeño. Las
+    ciudades se numeran desde 1, como en la matriz de listas.
+    """
+
+    # Métricas con resultado entero (redondeo al más cercano, como TSPLIB);
+    # todas cumplen metrica(dx, dy) == metrica(-dx, -dy)
+    METRICAS = {
+        "euclidea": lambda dx, dy: int(math.hypot(dx, dy) + 0.5),
+        "manhattan": lambda dx, dy: int(abs(dx) + abs(dy) + 0.5),
+        "maximo": lambda dx, dy: int(max(abs(dx), abs(dy)) + 0.5),
+    }
+
+    def __init__(self, coordenadas: Sequence[Tuple[float, float]],
+                 metrica: Union[str, Callable[[float, float], int]] = "euclidea",
+                 filas_cache: int = 16, simetrica: Optional[bool] = None):
+        """
+        Args:
+            coordenadas: (x, y) de las ciudades 1..n, en ese orden
+            metrica: Nombre de METRICAS o función (dx, dy) -> distancia
+            filas_cache: Cantidad de filas completas que se guardan
+            simetrica: Si metrica(dx, dy) == metrica(-dx, -dy). Por defecto
+                True para las métricas de METRICAS y False para una función
+                propia, que así nunca se trata como simétrica sin saberlo
+        """
+        if isinstance(metrica, str):
+            if metrica not in self.METRICAS:
+                raise ValueError(f"Métrica desconocida: {metrica}")
+            metrica = self.METRICAS[metrica]
+            if simetrica is None:
+                simetrica = True
+        self.metrica = metrica
+        self.simetrica = bool(simetrica)
+        self.x = array('d', [0.0] + [p[0] for p in coordenadas])
+        self.y = array('d', [0.0] + [p[1] for p in coordenadas])
+        self.filas_cache = filas_cache
+        self._filas = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def distancia(self, i: int, j: int) -> int:
+        """Distancia entre las ciudades i y j."""
+        return self.metrica(self.x[i] - self.x[j], self.y[i] - self.y[j])
+
+    def __getitem__(self, i: int) -> List[int]:
+        """Fila i completa (posición 0 sin usar), desde el caché si está."""
+        fila = self._filas.get(i)
+        if fila is not None:
+            self._filas.move_to_end(i)
+            return fila
+
+        xi = self.x[i]
+        yi = self.y[i]
+        metrica = self.metrica
+        fila = [metrica(xi - x, yi - y) for x, y in zip(self.x, self.y)]
+        fila[0] = 0
+        self._filas[i] = fila
+        if len(self._filas) > self.filas_cache:
+            self._filas.popitem(last=False)
+        return fila
+
+
+class MatrizSimetrica:
+    """
+    Matriz de distancias simétrica que guarda solo el triángulo superior
+    (i < j) en un arreglo tipado, n(n-1)/2 enteros de máquina en vez de n²
+    objetos int de Python.
+
+    distancia(i, j) es O(1) en cualquier orden de i y j; matriz[i] arma la
+    fila i completa como lista. Las ciudades se numeran desde 1 y la
+    diagonal vale 0.
     """
-    return chr(ciudad + 96)
+
+    simetrica = True
+
+    def __init__(self, n: int, tipo: str = 'l'):
+        """
+        Args:
+            n: Número de ciudades
+            tipo: Código de tipo de array ('l', 'i', 'h', 'd', ...)
+        """
+        self.n = n
+        # La fila i ocupa datos[inicio[i] + j] para j = i+1..n
+        self.inicio = array('l', [0]) * (n + 1)
+        desplazamiento = 0
+        for i in range(1, n + 1):
+            self.inicio[i] = desplazamiento - (i + 1)
+            desplazamiento += n - i
+        self.datos = array(tipo, [0]) * desplazamiento
+
+    @classmethod
+    def desde_matriz(cls, matriz: List[List[int]], n: int,
+                     tipo: str = 'l') -> 'MatrizSimetrica':
+        """
+        Copia el triángulo superior de una matriz de listas (1-indexada).
+        """
+        simetrica = cls(n, tipo)
+        for i in range(1, n):
+            inicio = simetrica.inicio[i]
+            simetrica.datos[inicio + i + 1:inicio + n + 1] = array(
+                tipo, matriz[i][i + 1:n + 1])
+        return simetrica
+
+    def __len__(self) -> int:
+        return self.n + 1
+
+    def fijar(self, i: int, j: int, valor: int):
+        """Asigna la distancia entre las ciudades i y j (i != j)."""
+        if not (1 <= i <= self.n and 1 <= j <= self.n):
+            raise IndexError(f"Ciudad fuera de 1..{self.n}: ({i}, {j})")
+        if i == j:
+            raise ValueError(f"La diagonal vale 0 y no se guarda: ({i}, {j})")
+        if i > j:
+            i, j = j, i
+        self.datos[self.inicio[i] + j] = valor
+
+    def distancia(self, i: int, j: int) -> int:
+        """Distancia entre las ciudades i y j."""
+        if i < j:
+            if 1 <= i and j <= self.n:
+                return self.datos[self.inicio[i] + j]
+        elif i > j:
+            if 1 <= j and i <= self.n:
+                return self.datos[self.inicio[j] + i]
+        elif 1 <= i <= self.n:
+            return 0
+        raise IndexError(f"Ciudad fuera de 1..{self.n}: ({i}, {j})")
+
+    def __getitem__(self, i: int) -> List[int]:
+        """Fila i completa (posición 0 sin usar)."""
+        if not 1 <= i <= self.n:
+            raise IndexError(f"Ciudad fuera de 1..{self.n}: {i}")
+        datos = self.datos
+        inicio = self.inicio
+        fila = [0] + [datos[k + i] for k in inicio[1:i]] + [0]
+        fila += datos[inicio[i] + i + 1:inicio[i] + self.n + 1].tolist()
+        return fila
 
 
 class ProblemaVendedor:
-    def __init__(self, matriz: List[List[int]], n: int):
+    # Cotas inferiores de la ramificación y acotamiento: nombre -> método
+    # que prepara la función de cota
+    COTAS = {
+        "minima": "_cota_minima",
+        "reducida": "_cota_reducida",
+        "arbol": "_cota_arbol",
+    }
+
+    def __init__(self, matriz: Union[List[List[int]], MatrizCoordenadas, MatrizSimetrica],
+                 n: int,
+                 etiquetas: Callable[[int], str] = letra):
         """
         Inicializa el problema del Vendedor Viajero.
 
+        Las distancias se leen siempre con distancia(i, j) o, para comparar
+        las que salen de una ciudad, con distancias_desde(i); así matriz
+        puede ser cualquier tabla indexable como matriz[i][j] (listas,
+        tuplas, arreglos de numpy) o un objeto con distancia(i, j), como
+        MatrizCoordenadas o MatrizSimetrica. Los métodos exactos, pensados
+        para pocas ciudades, trabajan sobre _tabla(), que arma con ellas la
+        tabla completa.
+
         Args:
-            matriz: Matriz de distancias.
+            matriz: Matriz de distancias, MatrizCoordenadas o MatrizSimetrica.
             n: Número de ciudades.
+            etiquetas: Nombre de cada ciudad en el camino de la solución.
         """
         self.matriz = matriz
         self.n = n
+        self.etiquetas = etiquetas
+        self.simetrica = getattr(matriz, 'simetrica', None)
+        if self.simetrica is None:
+            self.simetrica = all(matriz[i][j] == matriz[j][i]
+                                 for i in range(1, n + 1) for j in range(i + 1, n + 1))
+
+        # Lectura de una distancia, elegida una sola vez: el método distancia
+        # de la matriz (MatrizCoordenadas, MatrizSimetrica) o matriz[i][j]
+        # para cualquier tabla indexable (listas, tuplas, arreglos de numpy)
+        self._indexable = not hasattr(matriz, 'distancia')
+        if self._indexable:
+            self._distancia = self._distancia_tabla
+        else:
+            self._distancia = matriz.distancia
+
+    def distancia(self, i: int, j: int) -> int:
+        """Distancia de la ciudad i a la ciudad j."""
+        return self._distancia(i, j)
+
+    def _distancia_tabla(self, i: int, j: int) -> int:
+        """Distancia leída de una tabla indexable."""
+        return self.matriz[i][j]
+
+    def distancias_desde(self, i: int, completa: bool = False) -> Callable[[int], int]:
+        """
+        Función j -> distancia(i, j), para usar como key de min() o sorted().
+
+        Args:
+            i: Ciudad de origen
+            completa: Si se va a pedir la distancia a casi todas las
+                ciudades: arma una vez la fila i y lee de ella en vez de
+                calcular cada par. Con una tabla indexable la fila ya
+                existe y no se arma nada en ningún caso.
+        """
+        if completa or self._indexable:
+            return self.matriz[i].__getitem__
+        return partial(self._distancia, i)
+
+    def _tabla(self) -> List[List[int]]:
+        """
+        Matriz de distancias completa como lista de listas. Si matriz no es
+        ya una lista de listas (coordenadas, MatrizSimetrica, tuplas, numpy)
+        se arma en cada llamada y no se guarda: ocupa O(n²) solo mientras
+        dura la búsqueda exacta que la pidió.
+        """
+        matriz = self.matriz
+        if isinstance(matriz, list) and all(type(fila) is list for fila in matriz):
+            return matriz
+        ciudades = range(1, self.n + 1)
+        return [[0] * (self.n + 1)] + [
+            [0] + list(map(self.distancias_desde(i, completa=True), ciudades))
+            for i in ciudades]
+
+    def _tipo_distancias(self, matriz: List[List[int]]) -> str:
+        """
+        Código de array para guardar distancias de la tabla matriz: 'q'
+        (enteros de 64 bits) si todas son enteras (int o enteros de numpy) y
+        'd' (dobles) si no.
+        """
+        n = self.n
+        if all(isinstance(x, Integral) for i in range(1, n + 1) for x in matriz[i][1:n + 1]):
+            return 'q'
+        return 'd'
+
+    def _camino(self, ruta) -> List[str]:
+        """
+        Convierte una ruta de enteros (ciudades en ruta[1..n]) al camino de
+        la solución: etiquetas en las posiciones 1..n y el regreso a 1.
+        """
+        etiquetas = self.etiquetas
+        return [None] + [etiquetas(ruta[k]) for k in range(1, self.n + 1)] + [etiquetas(1)]
 
     def busqueda_greedy(self) -> SolucionVendedor:
         """
@@ -38,48 +294,50 @@ class ProblemaVendedor:
         Returns:
             Solución del problema.
         """
+        ruta, costo_total = self._ruta_greedy()
+        return SolucionVendedor(camino=self._camino(ruta), costo=costo_total)
 
-        sol = SolucionVendedor(
-            camino=[None] * (self.n + 2),
-            costo=0
-        )
-
-        visitado = [False] * (self.n + 1)
+    def _ruta_greedy(self):
+        """
+        Ruta del vecino más cercano como arreglo de enteros (ruta[1..n]) y
+        su costo.
+        """
+        ruta = array('l', [0]) * (self.n + 2)
+        pendientes = list(range(2, self.n + 1))     # En orden creciente
         actual = 1
+        distancia = self._distancia
 
-        visitado[1] = True
-        sol.camino[1] = letra(1)
+        ruta[1] = 1
         costo_total = 0
 
         for pos in range(2, self.n + 1):
-            mejor = None
-            mejor_costo = float('inf')
-
-            for j in range(1, self.n + 1):
-                if j != actual and not visitado[j]:
-                    if self.matriz[actual][j] < mejor_costo:
-                        mejor = j
-                        mejor_costo = self.matriz[actual][j]
-
-            visitado[mejor] = True
-            costo_total += mejor_costo
-            sol.camino[pos] = letra(mejor)
+            # min() devuelve la primera ciudad de menor distancia, como el
+            # recorrido por índice creciente
+            mejor = min(pendientes, key=self.distancias_desde(actual))
+            pendientes.remove(mejor)
+
+            costo_total += distancia(actual, mejor)
+            ruta[pos] = mejor
             actual = mejor
 
-        costo_total += self.matriz[actual][1]
-        sol.camino[self.n + 1] = letra(1)
-        sol.costo = costo_total
+        costo_total += self.distancia(actual, 1)
+        ruta[self.n + 1] = 1
 
-        return sol
+        return ruta, costo_total
 
     def busqueda_exhaustiva_pura(self) -> SolucionVendedor:
         """
         Búsqueda Exhaustiva Pura:
         Explora todas las permutaciones posibles de ciudades.
 
+        Con matriz simétrica cada ciclo y su reverso cuestan lo mismo, así
+        que solo se recorren los que visitan la ciudad 2 antes que la 3
+        ((n-1)!/2 rutas); con matriz asimétrica se recorren todas.
+
         Returns:
             Solución óptima (de menor costo).
         """
+        matriz = self._tabla()
 
         sol = SolucionVendedor(
             camino=[None] * (self.n + 2),
@@ -87,122 +345,944 @@ class ProblemaVendedor:
             soluciones_factibles=0
         )
 
-        mejor_camino = None
-        mejor_costo = float('inf')
+        espejo = self.simetrica and self.n >= 3     # Saltar ciclos reversos
+        busqueda = _ExhaustivaVendedor(matriz, self.n, espejo)
+        busqueda.ejecutar()
+        sol.soluciones_factibles = busqueda.soluciones_factibles
 
-        visitado = [False] * (self.n + 1)
-        camino = [None] * (self.n + 2)
+        sol.camino = self._camino(busqueda.mejor_ruta)
+        sol.costo = busqueda.mejor_costo
 
-        def backtrack(k: int, actual: int, costo_actual: int):
-            """
-            Función recursiva para explorar todas las rutas posibles.
+        return sol
 
-            Args:
-                k: posición actual dentro del camino
-                actual: ciudad actual
-                costo_actual: costo acumulado hasta este punto
-            """
-            nonlocal mejor_camino, mejor_costo
+    def busqueda_exhaustiva_ra(self, cota: str = "minima", memo: int = 0) -> SolucionVendedor:
+        """
+        Búsqueda Exhaustiva con Ramificación y Acotamiento.
 
-            if k == self.n + 1:
-                costo_total = costo_actual + self.matriz[actual][1]
-                sol.soluciones_factibles += 1
+        La cota inferior de cada nodo se elige con el parámetro cota:
+            "minima":   costo actual + (ciudades restantes) * (menor arista)
+            "reducida": matriz reducida de Little, actualizada de padre a hijo
+            "arbol":    1-árbol de Held-Karp con penalizaciones lagrangianas
 
-                if costo_total < mejor_costo:
-                    mejor_costo = costo_total
-                    mejor_camino = camino[:]
-                    mejor_camino[self.n + 1] = letra(1)
+        Con matriz simétrica se descartan los ciclos reversos exigiendo que
+        la ciudad 2 vaya antes que la 3, como en la búsqueda pura.
 
-                return
+        La mejor solución parte de la ruta greedy y desde cada ciudad se
+        ramifica primero hacia las más cercanas, así que las buenas rutas
+        aparecen pronto y la poda empieza desde el primer nodo.
 
-            for ciudad in range(2, self.n + 1):
-                if not visitado[ciudad]:
-                    visitado[ciudad] = True
-                    camino[k] = letra(ciudad)
+        Con memo > 0 se usa además una tabla de dominancia: dos rutas
+        parciales con el mismo conjunto de ciudades visitadas que terminan
+        en la misma ciudad tienen las mismas continuaciones, así que si se
+        llega a un estado (visitadas, actual) con costo mayor o igual al ya
+        guardado, la rama se poda. La tabla guarda a lo sumo memo estados y
+        descarta el menos usado recientemente.
 
-                    backtrack(k + 1, ciudad,
-                              costo_actual + self.matriz[actual][ciudad])
+        Args:
+            cota: Estrategia de cota inferior
+            memo: Máximo de estados en la tabla de dominancia (0: sin tabla)
 
-                    visitado[ciudad] = False
+        Returns:
+            Mejor solución encontrada; nodos_expandidos cuenta los nodos
+            visitados para comparar las cotas, y memo_aciertos / memo_podas
+            el uso de la tabla.
+        """
+        self._validar_cota(cota)
+        matriz = self._tabla()
+        ruta, sol = self._ramificar([1], matriz, self._estrategia_cota(cota, matriz),
+                                    memo=memo, semilla=self._ruta_greedy())
+        sol.camino = self._camino(ruta)
+        return sol
 
-        visitado[1] = True
-        camino[1] = letra(1)
+    def busqueda_exhaustiva_ra_paralela(self, cota: str = "minima",
+                                        procesos: Optional[int] = None,
+                                        niveles: int = 2) -> SolucionVendedor:
+        """
+        Ramificación y acotamiento repartida en un grupo de procesos.
 
-        backtrack(2, 1, 0)
+        El árbol se corta en los primeros niveles (segunda y tercera ciudad):
+        cada prefijo es una tarea que un proceso resuelve con _ramificar. La
+        matriz se copia una sola vez a multiprocessing.shared_memory (como
+        enteros de 64 bits, o como dobles si alguna distancia no es entera) y
+        cada proceso la lee al iniciar; el mejor costo conocido vive en un valor
+        compartido que todos consultan al podar, así que una buena ruta
+        encontrada en un proceso poda los subárboles de los demás.
 
-        sol.camino = mejor_camino
-        sol.costo = mejor_costo
+        Args:
+            cota: Estrategia de cota inferior (ver busqueda_exhaustiva_ra)
+            procesos: Cantidad de procesos (por defecto, uno por núcleo)
+            niveles: Niveles del árbol que se reparten como tareas
 
-        return sol
+        Returns:
+            Solución de costo óptimo, igual al de la búsqueda secuencial.
+        """
+        self._validar_cota(cota)            # Antes de crear procesos
+        n = self.n
+        niveles = max(1, min(niveles, n - 2))
+        if n < 4:
+            return self.busqueda_exhaustiva_ra(cota)
+        matriz = self._tabla()
+
+        espejo = self.simetrica
+        prefijos = [[1]]
+        for _ in range(niveles):
+            prefijos = [p + [c] for p in prefijos for c in range(2, n + 1)
+                        if c not in p and (c != 3 or 2 in p or not espejo)]
+
+        tipo = self._tipo_distancias(matriz)
+
+        memoria = shared_memory.SharedMemory(create=True, size=8 * (n + 1) ** 2)
+        try:
+            with memoryview(memoria.buf).cast(tipo) as plano:
+                for i in range(1, n + 1):
+                    plano[i * (n + 1) + 1:(i + 1) * (n + 1)] = array(tipo, matriz[i][1:n + 1])
 
-    def busqueda_exhaustiva_ra(self) -> SolucionVendedor:
+            ruta_greedy, costo_greedy = self._ruta_greedy()
+            incumbente = multiprocessing.RawValue('d', costo_greedy)
+            candado = multiprocessing.Lock()
+            with multiprocessing.Pool(procesos, initializer=_iniciar_trabajador,
+                                      initargs=(memoria.name, tipo, n, cota,
+                                                incumbente, candado)) as grupo:
+                resultados = grupo.map(_resolver_subarbol, prefijos, chunksize=1)
+        finally:
+            memoria.close()
+            memoria.unlink()
+
+        mejor_ruta = ruta_greedy
+        mejor_costo = costo_greedy
+        for ruta, parcial in resultados:
+            if parcial.costo < mejor_costo:
+                mejor_ruta = ruta
+                mejor_costo = parcial.costo
+
+        return SolucionVendedor(
+            camino=self._camino(mejor_ruta),
+            costo=mejor_costo,
+            soluciones_factibles=sum(r[1].soluciones_factibles for r in resultados),
+            nodos_expandidos=sum(r[1].nodos_expandidos for r in resultados)
+        )
+
+    def _estrategia_cota(self, cota: str, matriz: List[List[int]]):
         """
-        Búsqueda Exhaustiva con Ramificación y Acotamiento.
+        Prepara la función de cota inferior con el nombre dado sobre la
+        tabla matriz de _tabla().
+        """
+        self._validar_cota(cota)
+        return getattr(self, self.COTAS[cota])(matriz)
 
-        Utiliza una cota inferior de:
-            (ciudades restantes) * (menor arista del grafo)
+    def _validar_cota(self, cota: str):
+        """Verifica que cota sea un nombre de COTAS, sin preparar la cota."""
+        if cota not in self.COTAS:
+            raise ValueError(f"Cota desconocida: {cota}")
 
-        Returns:
-            Mejor solución encontrada.
+    def _ciudades_cercanas(self, matriz: List[List[int]]) -> List[List[int]]:
         """
-        sol = SolucionVendedor(
-            camino=[None] * (self.n + 2),
-            costo=0,
-            soluciones_factibles=0
-        )
+        Devuelve, para cada ciudad, las ciudades 2..n ordenadas por distancia
+        desde ella según la tabla matriz de _tabla(). Se calcula una sola vez
+        por instancia.
+        """
+        if getattr(self, '_cercanas', None) is None:
+            self._cercanas = [[]] + [
+                sorted(range(2, self.n + 1), key=matriz[i].__getitem__)
+                for i in range(1, self.n + 1)
+            ]
+        return self._cercanas
+
+    def _ramificar(self, prefijo: List[int], matriz: List[List[int]],
+                   cota_inferior, incumbente=None, candado=None, memo: int = 0,
+                   semilla=None) -> Tuple[Optional[array], SolucionVendedor]:
+        """
+        Ramificación y acotamiento del subárbol de las rutas que empiezan
+        con las ciudades de prefijo (prefijo[0] == 1).
 
-        mejor_camino = None
-        mejor_costo = float('inf')
+        Args:
+            prefijo: Ciudades ya fijadas al inicio de la ruta
+            matriz: Tabla de _tabla(), la misma con la que se preparó la cota
+            cota_inferior: Función de _estrategia_cota
+            incumbente: Valor compartido con el mejor costo de otros procesos
+            candado: Protege las actualizaciones de incumbente
+            memo: Máximo de estados en la tabla de dominancia (0: sin tabla)
+            semilla: (ruta, costo) inicial de la mejor solución, p. ej. greedy
 
+        Returns:
+            (mejor ruta o None, solución sin camino con costo y estadísticas)
+        """
         visitado = [False] * (self.n + 1)
-        camino = [None] * (self.n + 2)
+        ruta = array('l', [0]) * (self.n + 2)
+        costo_actual = 0
+        visitadas = 0               # Bit c: la ciudad c ya está en la ruta
 
+        # Recorrer el prefijo dejando preparadas las cotas de sus niveles
+        visitado[1] = True
+        ruta[1] = 1
+        for k, ciudad in enumerate(prefijo[1:], start=2):
+            if cota_inferior(k, ruta, visitado, costo_actual) == float('inf'):
+                return None, SolucionVendedor(camino=None, costo=float('inf'))
+            visitado[ciudad] = True
+            visitadas ^= 1 << ciudad
+            ruta[k] = ciudad
+            costo_actual += matriz[ruta[k - 1]][ciudad]
+
+        busqueda = _RamificacionVendedor(
+            matriz, self.n, self._ciudades_cercanas(matriz), len(prefijo) + 1,
+            ruta, visitado, visitadas, costo_actual, cota_inferior,
+            espejo=self.simetrica and self.n >= 3, incumbente=incumbente,
+            candado=candado, memo=memo, semilla=semilla)
+        busqueda.ejecutar()
+
+        return busqueda.mejor_ruta, SolucionVendedor(
+            camino=None,
+            costo=busqueda.mejor_costo,
+            soluciones_factibles=busqueda.soluciones_factibles,
+            nodos_expandidos=busqueda.nodos,
+            memo_aciertos=busqueda.aciertos,
+            memo_podas=busqueda.podas
+        )
+
+    # --------------------------------------------------------------------
+    # COTAS INFERIORES PARA RAMIFICACIÓN Y ACOTAMIENTO
+    # --------------------------------------------------------------------
+    # Cada _cota_*(matriz) prepara lo que necesita una sola vez a partir de
+    # la tabla de _tabla() y devuelve una función cota(k, ruta, visitado,
+    # costo_actual) para el nodo del nivel k, donde ruta[1..k-1] son las
+    # ciudades ya colocadas.
+
+    def _cota_minima(self, matriz: List[List[int]]):
+        """Costo actual más la menor arista por cada ciudad restante."""
         min_arista = min(
-            self.matriz[i][j]
+            matriz[i][j]
             for i in range(1, self.n + 1)
             for j in range(1, self.n + 1)
             if i != j
         )
+        n = self.n
+
+        def cota(k, ruta, visitado, costo_actual):
+            return costo_actual + (n - k + 1) * min_arista
 
-        def backtrack(k: int, actual: int, costo_actual: int):
+        return cota
+
+    def _cota_reducida(self, matriz: List[List[int]]):
+        """
+        Cota de Little: toda fila y columna de la matriz reducida tiene un
+        cero, así que la suma de lo restado es una cota del ciclo. Al
+        agregar la arista (a, c) el hijo copia la matriz de su padre, anula
+        la fila a, la columna c y la arista de regreso (c, 1), y vuelve a
+        reducir solo las filas y columnas que pudieron perder su cero: las
+        filas con cero en la columna c, las columnas con cero en la fila a,
+        la fila c y la columna 1. cota(hijo) = cota(padre) + M[a][c] +
+        reducción.
+        """
+        n = self.n
+        infinito = float('inf')
+
+        def reducir(reducida, filas, columnas) -> float:
+            """
+            Reduce en su lugar las filas y luego las columnas indicadas y
+            devuelve lo restado.
             """
-            Función recursiva con poda por cota.
+            total = 0
+            for i in filas:
+                fila = reducida[i]
+                minimo = min(fila)
+                if 0 < minimo < infinito:
+                    reducida[i] = [x - minimo for x in fila]
+                    total += minimo
+            for j in columnas:
+                minimo = min(fila[j] for fila in reducida)
+                if 0 < minimo < infinito:
+                    for fila in reducida:
+                        fila[j] -= minimo
+                    total += minimo
+            return total
+
+        raiz = [[infinito] * (n + 1)]
+        for i in range(1, n + 1):
+            fila = [infinito] + matriz[i][1:n + 1]
+            fila[i] = infinito
+            raiz.append(fila)
+        raiz[0] = [infinito] * (n + 1)
+        if n > 1:
+            raiz_cota = reducir(raiz, range(n + 1), range(n + 1))
+        else:
+            raiz_cota = 0
+
+        # niveles[t]: (matriz reducida, cota) con t ciudades colocadas
+        niveles = [None] * (n + 2)
+        niveles[1] = (raiz, raiz_cota)
+
+        def cota(k, ruta, visitado, costo_actual):
+            if k == 2:
+                return raiz_cota
+            a = ruta[k - 2]
+            c = ruta[k - 1]
+            padre, cota_padre = niveles[k - 2]
+            arista = padre[a][c]
+            if arista == infinito:
+                return infinito
+
+            filas = [i for i in range(1, n + 1) if padre[i][c] == 0 and i != a]
+            columnas = [j for j in range(1, n + 1) if padre[a][j] == 0 and j != c]
+
+            hija = [fila[:] for fila in padre]
+            hija[a] = [infinito] * (n + 1)
+            for fila in hija:
+                fila[c] = infinito
+            if k <= n:
+                hija[c][1] = infinito       # No volver a 1 antes de tiempo
+                filas.append(c)
+                columnas.append(1)
+
+            valor = cota_padre + arista + reducir(hija, filas, columnas)
+            niveles[k - 1] = (hija, valor)
+            return valor
+
+        return cota
+
+    def _cota_arbol(self, matriz: List[List[int]]):
+        """
+        Cota de Held-Karp: el resto de la ruta, de la ciudad actual a por
+        las no visitadas U hasta volver a 1, es un árbol generador de
+        U ∪ {a, 1} (un 1-árbol en la raíz). Con costos simétricos
+        min(d[i][j], d[j][i]) y penalizaciones π por ciudad,
+
+            resto >= MST_π(U ∪ {a, 1}) - 2·Σ_U π - π_a - π_1
+
+        para cualquier π. Las π se ajustan una sola vez en la raíz por
+        subgradiente y la matriz penalizada se calcula de antemano.
+
+        El árbol se mantiene a lo largo de la rama: el conjunto del hijo es
+        el del padre sin la ciudad a del padre, así que el hijo copia el
+        árbol de su padre (enraizado en la ciudad 1) y solo quita ese
+        vértice. Si era una hoja basta con quitar su arista; si no, los
+        subárboles que colgaban de él se reconectan con Prim sobre sus
+        vértices, sin recalcular el resto del árbol.
+        """
+        n = self.n
+        ciudades = list(range(1, n + 1))
+        simetrica = [[0] * (n + 1) for _ in range(n + 1)]
+        for i in ciudades:
+            for j in ciudades:
+                if i != j:
+                    simetrica[i][j] = min(matriz[i][j], matriz[j][i])
+
+        def arbol_minimo(pesos, nodos, grados=None, padres=None):
             """
-            nonlocal mejor_camino, mejor_costo
+            Prim en O(k²) sobre nodos; suma 1 al grado de cada extremo y
+            anota en padres el padre de cada nodo (raíz: nodos[0]).
+            """
+            fuera = nodos[1:]
+            distancia = [pesos[nodos[0]][v] for v in fuera]
+            padre = [nodos[0]] * len(fuera)
+            total = 0
+            while fuera:
+                t = distancia.index(min(distancia))
+                total += distancia.pop(t)
+                v = fuera.pop(t)
+                u = padre.pop(t)
+                if grados is not None:
+                    grados[u] += 1
+                    grados[v] += 1
+                if padres is not None:
+                    padres[v] = u
+                fila = pesos[v]
+                for t, w in enumerate(fuera):
+                    if fila[w] < distancia[t]:
+                        distancia[t] = fila[w]
+                        padre[t] = v
+            return total
+
+        def uno_arbol(pesos, grados=None):
+            """MST de 2..n más las dos aristas más baratas de la ciudad 1."""
+            total = arbol_minimo(pesos, ciudades[1:], grados)
+            dos = sorted(ciudades[1:], key=lambda j: pesos[1][j])[:2]
+            for j in dos:
+                total += pesos[1][j]
+                if grados is not None:
+                    grados[1] += 1
+                    grados[j] += 1
+            return total
+
+        # Subgradiente en la raíz: acercar cada grado del 1-árbol a 2
+        pi = [0.0] * (n + 1)
+        mejor_pi = pi[:]
+        if n >= 3:
+            superior = self._ruta_greedy()[1]
+            mejor_valor = -float('inf')
+            paso = 2.0
+            for iteracion in range(10 * n):
+                pesos = [[simetrica[i][j] + pi[i] + pi[j] for j in range(n + 1)]
+                         for i in range(n + 1)]
+                grados = [0] * (n + 1)
+                valor = uno_arbol(pesos, grados) - 2 * sum(pi)
+                if valor > mejor_valor:
+                    mejor_valor = valor
+                    mejor_pi = pi[:]
+                norma = sum((g - 2) ** 2 for g in grados[1:])
+                if norma == 0:
+                    break
+                t = paso * (superior - valor) / norma
+                pi = [p + t * (g - 2) for p, g in zip(pi, grados)]
+                if iteracion % n == n - 1:
+                    paso /= 2
+
+        pi = mejor_pi
+        pesos = [[simetrica[i][j] + pi[i] + pi[j] for j in range(n + 1)]
+                 for i in range(n + 1)]
+
+        def quitar_vertice(padre, total, x):
+            """
+            Quita x (distinto de 1) del árbol padre, enraizado en la ciudad 1
+            (padre 0: fuera del árbol), reconecta sus subárboles y devuelve
+            el nuevo peso.
+            """
+            total -= pesos[x][padre[x]]
+            padre[x] = 0
+            hijos = []
+            i = 1
+            while True:
+                try:
+                    i = padre.index(x, i + 1)
+                except ValueError:
+                    break
+                hijos.append(i)
+            if not hijos:
+                return total
+
+            # componente[v]: hijo de x cuyo subárbol contiene a v (1: el resto)
+            componente = [0] * (n + 1)
+            componente[1] = 1
+            for h in hijos:
+                total -= pesos[h][x]
+                componente[h] = h
+            for v in ciudades:
+                if padre[v] and not componente[v]:
+                    camino = []
+                    while not componente[v]:
+                        camino.append(v)
+                        v = padre[v]
+                    for u in camino:
+                        componente[u] = componente[v]
+
+            # Prim desde el resto del árbol sobre los vértices colgados de x
+            dentro = [v for v in ciudades if componente[v] == 1]
+            fuera = [v for v in ciudades if componente[v] > 1]
+            distancia = []
+            cerca = []
+            for v in fuera:
+                fila = pesos[v]
+                u = min(dentro, key=fila.__getitem__)
+                distancia.append(fila[u])
+                cerca.append(u)
+            while fuera:
+                t = distancia.index(min(distancia))
+                total += distancia[t]
+                v = fuera[t]
+                raiz = componente[v]
+
+                # Reenraizar el subárbol en v colgándolo de cerca[t]
+                anterior, u = cerca[t], v
+                while True:
+                    siguiente = padre[u]
+                    padre[u] = anterior
+                    if u == raiz:
+                        break
+                    anterior, u = u, siguiente
+
+                # Pasar todo el subárbol adentro y actualizar distancias
+                nuevos = [w for w in fuera if componente[w] == raiz]
+                quedan = [t for t, w in enumerate(fuera) if componente[w] != raiz]
+                fuera = [fuera[t] for t in quedan]
+                distancia = [distancia[t] for t in quedan]
+                cerca = [cerca[t] for t in quedan]
+                for y in nuevos:
+                    fila = pesos[y]
+                    for t, w in enumerate(fuera):
+                        if fila[w] < distancia[t]:
+                            distancia[t] = fila[w]
+                            cerca[t] = y
+            return total
+
+        # niveles[k]: (padre, peso, Σ_U π) del árbol de U ∪ {a, 1} en el nodo
+        # del nivel k, para derivar de él los de sus hijos
+        niveles = [None] * (n + 2)
+        suma_pi = sum(pi[1:])
+
+        def cota(k, ruta, visitado, costo_actual):
+            a = ruta[k - 1]
+            if k == n + 1:
+                return costo_actual + simetrica[a][1]
+            if k == 2:
+                # En la raíz a == 1: 1-árbol sobre todas las ciudades
+                if n == 2:
+                    return 2 * simetrica[1][2]
+                return uno_arbol(pesos) - 2 * suma_pi
+            if k == 3:
+                padre = [0] * (n + 1)
+                total = arbol_minimo(pesos, ciudades, padres=padre)
+                restante_pi = suma_pi - pi[1] - pi[a]
+            else:
+                padre_previo, total_previo, pi_previo = niveles[k - 1]
+                padre = padre_previo[:]
+                total = quitar_vertice(padre, total_previo, ruta[k - 2])
+                restante_pi = pi_previo - pi[a]
+            niveles[k] = (padre, total, restante_pi)
+            return costo_actual + total - (2 * restante_pi + pi[a] + pi[1])
+
+        return cota
+
+    def busqueda_local(self, ruta: List[int] = None, vecinos: int = 8) -> SolucionVendedor:
+        """
+        Búsqueda local 2-opt / Or-opt a partir de la ruta greedy o de una dada.
+
+        Cada ciudad solo se compara con sus k vecinos más cercanos (listas
+        precalculadas) y tiene un bit "no mirar": sale de la cola cuando no
+        encuentra mejora y vuelve a entrar solo si un movimiento toca una de
+        sus aristas, así que cada pasada cuesta O(n·k) evaluaciones.
+
+        - 2-opt: cambia las aristas (a, b) y (c, e) por (a, c) y (b, e)
+          invirtiendo el tramo entre ellas (solo con matriz simétrica).
+        - Or-opt: mueve un tramo de 1 a 3 ciudades junto a un vecino de su
+          primera ciudad, en el mismo sentido o (si es simétrica) invertido.
+
+        Args:
+            ruta: Ciudades en orden (permutación de 1..n); por defecto greedy
+            vecinos: Tamaño k de las listas de vecinos
+
+        Returns:
+            Solución con costo_inicial y la cantidad de movimientos aplicados.
+        """
+        n = self.n
+        d = self._distancia
+        if ruta is None:
+            ruta = self._ruta_greedy()[0][1:n + 1]
+
+        gira = list(ruta)
+        costo_inicial = sum(d(gira[t - 1], gira[t]) for t in range(n))
+        movimientos = 0
+
+        if n >= 5:
+            cercanos = [[]] + [
+                heapq.nsmallest(vecinos, (j for j in range(1, n + 1) if j != i),
+                                key=self.distancias_desde(i, completa=True))
+                for i in range(1, n + 1)
+            ]
+            pos = [0] * (n + 1)
+            for t, c in enumerate(gira):
+                pos[c] = t
 
-            restantes = self.n - k + 1
-            costo_estimado = costo_actual + restantes * min_arista
+            def sucesor(c: int) -> int:
+                return gira[pos[c] + 1 - n]
 
-            if costo_estimado >= mejor_costo:
-                return
-            
-            if k == self.n + 1:
-                costo_total = costo_actual + self.matriz[actual][1]
-                sol.soluciones_factibles += 1
+            def predecesor(c: int) -> int:
+                return gira[pos[c] - 1]
 
+            def invertir(i: int, j: int):
+                """Invierte el tramo cíclico de posiciones i..j (el más corto)."""
+                largo = (j - i) % n + 1
+                if 2 * largo > n:
+                    i, j = (j + 1) % n, (i - 1) % n
+                    largo = n - largo
+                for _ in range(largo // 2):
+                    gira[i], gira[j] = gira[j], gira[i]
+                    pos[gira[i]] = i
+                    pos[gira[j]] = j
+                    i = (i + 1) % n
+                    j = (j - 1) % n
+
+            def mover(tramo: List[int], despues_de: int, invertido: bool):
+                """Saca el tramo y lo reinserta a continuación de despues_de."""
+                fuera = set(tramo)
+                resto = [c for c in gira if c not in fuera]
+                t = resto.index(despues_de) + 1
+                resto[t:t] = tramo[::-1] if invertido else tramo
+                gira[:] = resto
+                for t, c in enumerate(gira):
+                    pos[c] = t
+
+            def dos_opt(a: int) -> List[int]:
+                for sentido in (sucesor, predecesor):
+                    b = sentido(a)
+                    dab = d(a, b)
+                    for c in cercanos[a]:
+                        dac = d(a, c)
+                        if dac >= dab:
+                            break
+                        e = sentido(c)
+                        if c == b or e == a:
+                            continue
+                        if dac + d(b, e) < dab + d(c, e):
+                            if sentido is sucesor:
+                                invertir(pos[b], pos[c])
+                            else:
+                                invertir(pos[a], pos[e])
+                            return [a, b, c, e]
+                return []
+
+            def or_opt(a: int) -> List[int]:
+                tramo = [a]
+                for _ in range(3):
+                    e = tramo[-1]
+                    p = predecesor(a)
+                    x = sucesor(e)
+                    if x == p or len(tramo) > n - 3:
+                        break
+                    ahorro = d(p, a) + d(e, x) - d(p, x)
+                    for c in cercanos[a]:
+                        if c in tramo:
+                            continue
+                        # c, a..e, sucesor(c)
+                        c2 = sucesor(c)
+                        if c != p and d(c, a) + d(e, c2) - d(c, c2) < ahorro:
+                            mover(tramo, c, False)
+                            return [p, x, c, c2, a, e]
+                        # predecesor(c), e..a, c
+                        c1 = predecesor(c)
+                        if self.simetrica and c != x and \
+                                d(c1, e) + d(a, c) - d(c1, c) < ahorro:
+                            mover(tramo, c1, True)
+                            return [p, x, c1, c, a, e]
+                    tramo.append(x)
+                return []
+
+            cola = deque(gira)
+            en_cola = [True] * (n + 1)
+            while cola:
+                a = cola.popleft()
+                en_cola[a] = False
+                tocadas = (dos_opt(a) if self.simetrica else []) or or_opt(a)
+                if tocadas:
+                    movimientos += 1
+                    for c in tocadas:
+                        if not en_cola[c]:
+                            en_cola[c] = True
+                            cola.append(c)
+
+        # La ruta del resultado empieza y termina en la ciudad 1
+        inicio = gira.index(1)
+        gira = gira[inicio:] + gira[:inicio]
+        return SolucionVendedor(
+            camino=self._camino([0] + gira),
+            costo=sum(d(gira[t - 1], gira[t]) for t in range(n)),
+            costo_inicial=costo_inicial,
+            movimientos=movimientos
+        )
+
+    def busqueda_held_karp(self) -> SolucionVendedor:
+        """
+        Programación dinámica de Held-Karp en O(n²·2^n).
+
+        costo[S, j] es el menor costo de salir de la ciudad 1, visitar
+        exactamente el conjunto S (ciudades 2..n como bits) y terminar en
+        j ∈ S:
+
+            costo[S, j] = min_{i ∈ S - {j}} costo[S - {j}, i] + matriz[i][j]
+
+        La tabla y los punteros al predecesor son arreglos tipados planos
+        indexados por S·(n-1) + j (8 y 1 bytes por estado), y cada mínimo se
+        calcula sobre una fila completa con map(add, ...) en C; los estados
+        imposibles valen infinito y nunca ganan. La tabla es de enteros de
+        64 bits si todas las distancias son enteras y de dobles si no.
+
+        Returns:
+            Solución óptima.
+        """
+        matriz = self._tabla()
+        m = self.n - 1
+        if m < 1:
+            return SolucionVendedor(camino=self._camino([0, 1]), costo=0)
+
+        tipo = self._tipo_distancias(matriz)
+        infinito = 1 << 62 if tipo == 'q' else float('inf')
+        columnas = [[matriz[i + 2][j + 2] for i in range(m)] for j in range(m)]
+        costo = array(tipo, [infinito]) * (m << m)
+        padre = array('B', bytes(m << m))
+
+        for j in range(m):
+            costo[(1 << j) * m + j] = matriz[1][j + 2]
+
+        for conjunto in range(3, 1 << m):
+            if not conjunto & (conjunto - 1):
+                continue            # Un solo bit: caso base
+            base = conjunto * m
+            resto = conjunto
+            while resto:
+                bit = resto & -resto
+                resto ^= bit
+                j = bit.bit_length() - 1
+                anterior = (conjunto ^ bit) * m
+                sumas = list(map(add, costo[anterior:anterior + m], columnas[j]))
+                mejor = min(sumas)
+                costo[base + j] = mejor
+                padre[base + j] = sumas.index(mejor)
+
+        # Cerrar el ciclo volviendo a la ciudad 1
+        completo = (1 << m) - 1
+        base = completo * m
+        ultima = min(range(m), key=lambda j: costo[base + j] + matriz[j + 2][1])
+        costo_total = costo[base + ultima] + matriz[ultima + 2][1]
+
+        ruta = array('l', [0]) * (self.n + 2)
+        ruta[1] = 1
+        conjunto = completo
+        j = ultima
+        for pos in range(self.n, 1, -1):
+            ruta[pos] = j + 2
+            anterior = padre[conjunto * m + j]
+            conjunto ^= 1 << j
+            j = anterior
+
+        return SolucionVendedor(camino=self._camino(ruta), costo=costo_total)
+
+
+# ------------------------------------------------------------------------
+# RECORRIDOS DE LAS BÚSQUEDAS EXHAUSTIVAS
+# ------------------------------------------------------------------------
+class _ExhaustivaVendedor(MotorBacktracking):
+    """
+    Recorre todas las rutas que salen de la ciudad 1: el nivel k coloca en
+    ruta[k] cada ciudad libre, en orden. opcion[k] es la próxima ciudad a
+    probar. Las hojas (nivel n + 1) se evalúan al generarlas desde el nivel
+    n, sin apilarlas.
+    """
+
+    def __init__(self, matriz: List[List[int]], n: int, espejo: bool):
+        super().__init__(2, n)
+        self.matriz = matriz
+        self.n = n
+        self.espejo = espejo        # Exigir la ciudad 2 antes que la 3
+        self.visitado = [False] * (n + 1)
+        self.visitado[1] = True
+        self.ruta = array('l', [0]) * (n + 2)
+        self.ruta[1] = 1
+        self.costo_actual = 0
+        self.mejor_ruta = None
+        self.mejor_costo = float('inf')
+        self.soluciones_factibles = 0
+        self.opcion[2] = 2
+        if n == 1:
+            # La raíz ya es la única hoja
+            self.soluciones_factibles = 1
+            self.mejor_costo = matriz[1][1]
+            self.mejor_ruta = self.ruta[:]
+            self.nivel = 1
+
+    def _recorrer(self, limite: int) -> int:
+        matriz = self.matriz
+        n = self.n
+        espejo = self.espejo
+        visitado = self.visitado
+        ruta = self.ruta
+        opcion = self.opcion
+        nivel = self.nivel
+        costo_actual = self.costo_actual
+        mejor_costo = self.mejor_costo
+        factibles = self.soluciones_factibles
+        visitados = 0
+
+        while visitados < limite:
+            ciudad = opcion[nivel]
+            while ciudad <= n and (visitado[ciudad] or
+                                   (ciudad == 3 and espejo and not visitado[2])):
+                ciudad += 1
+
+            if ciudad > n:
+                # Nivel agotado: volver al anterior y quitar su ciudad
+                nivel -= 1
+                if nivel < 2:
+                    break
+                c = ruta[nivel]
+                visitado[c] = False
+                costo_actual -= matriz[ruta[nivel - 1]][c]
+                continue
+
+            opcion[nivel] = ciudad + 1
+            visitados += 1
+            anterior = ruta[nivel - 1]
+            if nivel == n:
+                costo_total = costo_actual + matriz[anterior][ciudad] + matriz[ciudad][1]
+                factibles += 1
                 if costo_total < mejor_costo:
                     mejor_costo = costo_total
-                    mejor_camino = camino[:]
-                    mejor_camino[self.n + 1] = letra(1)
+                    ruta[n] = ciudad
+                    self.mejor_ruta = ruta[:]
+                continue
 
-                return
+            visitado[ciudad] = True
+            ruta[nivel] = ciudad
+            costo_actual += matriz[anterior][ciudad]
+            nivel += 1
+            opcion[nivel] = 2
 
-            for ciudad in range(2, self.n + 1):
-                if not visitado[ciudad]:
-                    visitado[ciudad] = True
-                    camino[k] = letra(ciudad)
+        self.nivel = nivel
+        self.costo_actual = costo_actual
+        self.mejor_costo = mejor_costo
+        self.soluciones_factibles = factibles
+        return visitados
 
-                    backtrack(k + 1, ciudad,
-                              costo_actual + self.matriz[actual][ciudad])
 
-                    visitado[ciudad] = False
+class _RamificacionVendedor(MotorBacktracking):
+    """
+    Ramificación y acotamiento del subárbol bajo una ruta parcial
+    ruta[1..inicio-1] (ver ProblemaVendedor._ramificar).
 
-        visitado[1] = True
-        camino[1] = letra(1)
+    self.nivel siempre apunta a un nodo recién generado, al que falta pasar
+    por la tabla de dominancia y la cota. El nivel k prueba las ciudades
+    libres en el orden de cercanía a ruta[k-1]; opcion[k] es la posición
+    en esa lista de la próxima a probar.
+    """
+
+    def __init__(self, matriz: List[List[int]], n: int, cercanas: List[List[int]],
+                 inicio: int, ruta: array, visitado: List[bool], visitadas: int,
+                 costo_actual: int, cota_inferior, espejo: bool,
+                 incumbente=None, candado=None, memo: int = 0, semilla=None):
+        super().__init__(inicio, n + 1)
+        self.matriz = matriz
+        self.n = n
+        self.cercanas = cercanas
+        self.ruta = ruta
+        self.visitado = visitado
+        self.visitadas = visitadas      # Bit c: la ciudad c ya está en la ruta
+        self.costo_actual = costo_actual
+        self.cota_inferior = cota_inferior
+        self.espejo = espejo
+        self.incumbente = incumbente
+        self.candado = candado
+        self.memo = memo
+        self.mejor_ruta, self.mejor_costo = semilla if semilla else (None, float('inf'))
+        self.soluciones_factibles = 0
 
-        backtrack(2, 1, 0)
+        # Tabla de dominancia: visitadas·(n+1) + actual -> menor costo visto
+        self.tabla = OrderedDict()
+        self.aciertos = 0
+        self.podas = 0
 
-        sol.camino = mejor_camino
-        sol.costo = mejor_costo
+    def _recorrer(self, limite: int) -> int:
+        matriz = self.matriz
+        n = self.n
+        cercanas = self.cercanas
+        ruta = self.ruta
+        visitado = self.visitado
+        cota_inferior = self.cota_inferior
+        espejo = self.espejo
+        incumbente = self.incumbente
+        memo = self.memo
+        tabla = self.tabla
+        opcion = self.opcion
+        base = self.nivel_inicial
+        nivel = self.nivel
+        visitadas = self.visitadas
+        costo_actual = self.costo_actual
+        mejor_costo = self.mejor_costo
+        visitados = 0
 
-        return sol
+        while visitados < limite:
+            ramas = True
+            if memo and nivel <= n:
+                clave = visitadas * (n + 1) + ruta[nivel - 1]
+                previo = tabla.get(clave)
+                if previo is None:
+                    tabla[clave] = costo_actual
+                    if len(tabla) > memo:
+                        tabla.popitem(last=False)
+                else:
+                    self.aciertos += 1
+                    tabla.move_to_end(clave)
+                    if costo_actual >= previo:
+                        self.podas += 1
+                        ramas = False
+                    else:
+                        tabla[clave] = costo_actual
+
+            if ramas:
+                cota = cota_inferior(nivel, ruta, visitado, costo_actual)
+                if cota >= mejor_costo or (incumbente is not None and
+                                           cota >= incumbente.value):
+                    ramas = False
+                elif nivel == n + 1:
+                    costo_total = costo_actual + matriz[ruta[n]][1]
+                    self.soluciones_factibles += 1
+                    if costo_total < mejor_costo:
+                        mejor_costo = costo_total
+                        self.mejor_ruta = ruta[:]
+                        if incumbente is not None:
+                            with self.candado:
+                                if costo_total < incumbente.value:
+                                    incumbente.value = costo_total
+                    ramas = False
+
+            # Siguiente rama: la próxima ciudad libre de este nivel o, si se
+            # agotaron, volver al anterior quitando su ciudad
+            posicion = 0 if ramas else n
+            while True:
+                lista = cercanas[ruta[nivel - 1]]
+                while posicion < n - 1:
+                    ciudad = lista[posicion]
+                    posicion += 1
+                    if not visitado[ciudad] and (ciudad != 3 or visitado[2] or not espejo):
+                        break
+                else:
+                    ciudad = 0
+                if ciudad:
+                    break
+
+                nivel -= 1
+                if nivel < base:
+                    break
+                ciudad = ruta[nivel]
+                visitado[ciudad] = False
+                visitadas ^= 1 << ciudad
+                costo_actual -= matriz[ruta[nivel - 1]][ciudad]
+                posicion = opcion[nivel]
+            if nivel < base:
+                break
+
+            opcion[nivel] = posicion
+            visitado[ciudad] = True
+            visitadas ^= 1 << ciudad
+            ruta[nivel] = ciudad
+            costo_actual += matriz[ruta[nivel - 1]][ciudad]
+            nivel += 1
+            visitados += 1
+
+        self.nivel = nivel
+        self.visitadas = visitadas
+        self.costo_actual = costo_actual
+        self.mejor_costo = mejor_costo
+        return visitados
+
+
+# ------------------------------------------------------------------------
+# PROCESOS DE LA RAMIFICACIÓN Y ACOTAMIENTO PARALELA
+# ------------------------------------------------------------------------
+# Cada proceso del grupo guarda aquí su copia del problema, que arma una sola
+# vez a partir de la memoria compartida.
+_trabajador = {}
+
+
+def _iniciar_trabajador(nombre: str, tipo: str, n: int, cota: str, incumbente,
+                        candado):
+    """Lee la matriz de la memoria compartida y prepara la cota del proceso."""
+    memoria = shared_memory.SharedMemory(name=nombre)
+    try:
+        with memoryview(memoria.buf).cast(tipo) as plano:
+            matriz = [plano[i * (n + 1):(i + 1) * (n + 1)].tolist()
+                      for i in range(n + 1)]
+    finally:
+        memoria.close()
+
+    problema = ProblemaVendedor(matriz, n)
+    _trabajador['problema'] = problema
+    _trabajador['matriz'] = matriz
+    _trabajador['cota'] = problema._estrategia_cota(cota, matriz)
+    _trabajador['incumbente'] = incumbente
+    _trabajador['candado'] = candado
+
+
+def _resolver_subarbol(prefijo: List[int]):
+    """Tarea del grupo: el subárbol de un prefijo, con la ruta como lista."""
+    problema = _trabajador['problema']
+    ruta, parcial = problema._ramificar(
+        prefijo, _trabajador['matriz'], _trabajador['cota'], _trabajador['incumbente'],
+        _trabajador['candado'])
+    return (ruta.tolist() if ruta is not None else None), parcial